@@ -4,9 +4,12 @@ JWT Authentication for I-Intern integration
 from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy import event, func, inspect, or_, update
+from typing import Dict, Optional, Tuple
+from datetime import timedelta
 import jwt
-from datetime import datetime
+import time
+import threading
 
 from config import settings
 from models import get_db
@@ -16,6 +19,21 @@ from models.multi_tenant import User, UserRole
 # Security scheme
 security = HTTPBearer(auto_error=False)
 
+# Decode key/algorithms built once - settings don't change at runtime
+_JWT_KEY = settings.JWT_SECRET.encode()
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+# Resolved users per I-Intern user id, so polling dashboards don't hit the DB
+# (and rewrite last_login) on every request. Per worker process; oldest entry evicted first.
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_SIZE = 10000
+_user_cache: Dict[str, Tuple[float, "CurrentUser"]] = {}
+# Writes and evictions come from threadpool handlers and flush events concurrently
+_user_cache_lock = threading.Lock()
+
+# last_login is written at most this often per user
+LAST_LOGIN_UPDATE_INTERVAL = timedelta(minutes=5)
+
 
 class CurrentUser:
     """Current authenticated user"""
@@ -67,7 +85,7 @@ def decode_i_intern_token(token: str) -> dict:
         print(f"[AUTH] Token (first 50 chars): {token[:50]}...")
         
         # Decode token
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         print(f"[AUTH] Token decoded successfully: {payload}")
         return payload
     except jwt.ExpiredSignatureError as e:
@@ -105,20 +123,61 @@ def get_or_create_user(db: Session, token_payload: dict) -> User:
         db.commit()
         db.refresh(user)
     else:
-        # Update last login
-        user.last_login = datetime.utcnow()
-        db.commit()
+        # Update last login - throttled, so cache refreshes don't write the row every time.
+        # The age check runs in SQL so it uses the same clock that wrote last_login
+        result = db.execute(
+            update(User)
+            .where(
+                User.id == user.id,
+                or_(User.last_login.is_(None), User.last_login < _last_login_cutoff(db)),
+            )
+            .values(last_login=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            db.commit()
     
     return user
 
 
-async def get_current_user(
+def _last_login_cutoff(db: Session):
+    """Database-side now() - LAST_LOGIN_UPDATE_INTERVAL (SQLite has no interval type)"""
+    if db.get_bind().dialect.name == "sqlite":
+        return func.datetime("now", f"-{int(LAST_LOGIN_UPDATE_INTERVAL.total_seconds())} seconds")
+    return func.now() - LAST_LOGIN_UPDATE_INTERVAL
+
+
+# Columns copied into CurrentUser - updates to anything else (e.g. last_login) keep the cache
+_CACHED_USER_FIELDS = ("i_intern_user_id", "email", "name", "role", "company_id")
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_user_cache(mapper, connection, target):
+    """Drop a cached user when a cached field changes (e.g. role or company reassigned)"""
+    attrs = inspect(target).attrs
+    if any(attrs[field].history.has_changes() for field in _CACHED_USER_FIELDS):
+        with _user_cache_lock:
+            _user_cache.pop(target.i_intern_user_id, None)
+            # A changed external id leaves the entry under the old key too
+            for old_id in attrs.i_intern_user_id.history.deleted:
+                _user_cache.pop(old_id, None)
+
+
+@event.listens_for(User, "after_delete")
+def _drop_deleted_user(mapper, connection, target):
+    """Drop a cached user when its row is deleted"""
+    with _user_cache_lock:
+        _user_cache.pop(target.i_intern_user_id, None)
+
+
+def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: Session = Depends(get_db)
 ) -> Optional[CurrentUser]:
     """
     Get current authenticated user from JWT token
     Returns None if no token provided (allows public access)
+    Sync so FastAPI runs the user lookup in its threadpool
     """
     if not credentials:
         return None
@@ -126,10 +185,17 @@ async def get_current_user(
     token = credentials.credentials
     payload = decode_i_intern_token(token)
     
+    # Token is still verified above; only the DB lookup is cached
+    i_intern_user_id = str(payload["user_id"])
+    now = time.monotonic()
+    cached = _user_cache.get(i_intern_user_id)
+    if cached and now - cached[0] < USER_CACHE_TTL_SECONDS:
+        return cached[1]
+    
     # Get or create user in database
     user = get_or_create_user(db, payload)
     
-    return CurrentUser(
+    current_user = CurrentUser(
         id=user.id,
         i_intern_user_id=user.i_intern_user_id,
         email=user.email,
@@ -137,6 +203,14 @@ async def get_current_user(
         role=user.role,
         company_id=user.company_id
     )
+    
+    with _user_cache_lock:
+        _user_cache.pop(i_intern_user_id, None)
+        if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+            _user_cache.pop(next(iter(_user_cache)), None)
+        _user_cache[i_intern_user_id] = (now, current_user)
+    
+    return current_user
 
 
 async def require_auth(
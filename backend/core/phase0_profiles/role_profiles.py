@@ -2,7 +2,8 @@
 Phase 0: Role Skill Profile Management
 Define and manage skill profiles for different internship roles
 """
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from pydantic import BaseModel
 
 
@@ -122,9 +123,10 @@ ROLE_PROFILES: Dict[str, RoleProfileSchema] = {
 
 
 class RoleProfileManager:
-    """Manage role profiles"""
+    """Manage role profiles (profiles are immutable, so lookups are cached)"""
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_profile(role_type: str) -> RoleProfileSchema:
         """Get profile for a role"""
         if role_type not in ROLE_PROFILES:
@@ -132,15 +134,17 @@ class RoleProfileManager:
         return ROLE_PROFILES[role_type]
     
     @staticmethod
-    def get_all_roles() -> List[str]:
-        """Get all available role types"""
-        return list(ROLE_PROFILES.keys())
+    @lru_cache(maxsize=None)
+    def get_all_roles() -> Tuple[str, ...]:
+        """Get all available role types (a tuple - the cached value is shared by every caller)"""
+        return tuple(ROLE_PROFILES.keys())
     
     @staticmethod
-    def get_required_skills(role_type: str) -> List[str]:
-        """Get required skill names for a role"""
+    @lru_cache(maxsize=None)
+    def get_required_skills(role_type: str) -> Tuple[str, ...]:
+        """Get required skill names for a role (a tuple, like get_all_roles)"""
         profile = RoleProfileManager.get_profile(role_type)
-        return [skill.skill_name for skill in profile.required_skills]
+        return tuple(skill.skill_name for skill in profile.required_skills)
     
     @staticmethod
     def get_all_skills(role_type: str) -> List[str]:
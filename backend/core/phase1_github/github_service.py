@@ -5,6 +5,8 @@ Handle candidate input, validate GitHub URLs, and clone repositories
 import os
 import re
 import shutil
+import time
+import threading
 from typing import Optional, Dict, Any
 from git import Repo, GitCommandError
 from github import Github, GithubException
@@ -21,6 +23,10 @@ except ImportError:
     create_storage_service = None
     STORAGE_AVAILABLE = False
 
+# Repository validation results are cached briefly to spare the GitHub API rate limit
+VALIDATION_CACHE_TTL_SECONDS = 300
+VALIDATION_CACHE_MAX_SIZE = 1024
+
 
 class CandidateInput(BaseModel):
     """Candidate input schema"""
@@ -76,6 +82,9 @@ class GitHubService:
         self.github_token = settings.GITHUB_TOKEN
         self.repos_dir = settings.REPOS_DIR
         self.github_client = None
+        self._validation_cache: Dict[str, float] = {}
+        # The service is shared by threadpool handlers - serialize cache writes/evictions
+        self._validation_cache_lock = threading.Lock()
         self.storage_provider = settings.STORAGE_PROVIDER
         
         # Initialize storage service with config
@@ -160,7 +169,7 @@ class GitHubService:
                 
         except GithubException as e:
             logger.error(f"GitHub API error: {e}")
-            raise ValueError(f"Failed to fetch repository info: {e}")
+            raise ValueError(f"Failed to fetch repository info: {e}") from e
         except Exception as e:
             logger.error(f"Error fetching repository info: {e}")
             raise
@@ -168,13 +177,38 @@ class GitHubService:
     def validate_repository(self, github_url: str) -> bool:
         """
         Validate that repository exists and is accessible
+        Only successes are cached (VALIDATION_CACHE_TTL_SECONDS per URL) - a private repo
+        also 404s, and must pass as soon as the candidate grants access
         """
+        now = time.monotonic()
+        validated_at = self._validation_cache.get(github_url)
+        if validated_at is not None and now - validated_at < VALIDATION_CACHE_TTL_SECONDS:
+            return True
+        
         try:
             self.get_repository_info(github_url)
-            return True
         except Exception as e:
             logger.error(f"Repository validation failed: {e}")
             return False
+        
+        self._cache_validation(github_url, now)
+        return True
+    
+    def _cache_validation(self, github_url: str, now: float):
+        """Store a successful validation, evicting expired or oldest entries when full"""
+        with self._validation_cache_lock:
+            self._validation_cache.pop(github_url, None)
+            if len(self._validation_cache) >= VALIDATION_CACHE_MAX_SIZE:
+                expired = [
+                    url for url, cached_at in self._validation_cache.items()
+                    if now - cached_at >= VALIDATION_CACHE_TTL_SECONDS
+                ]
+                for url in expired:
+                    del self._validation_cache[url]
+                if len(self._validation_cache) >= VALIDATION_CACHE_MAX_SIZE:
+                    del self._validation_cache[next(iter(self._validation_cache))]
+            
+            self._validation_cache[github_url] = now
     
     def clone_repository(self, github_url: str, candidate_id: int) -> str:
         """
@@ -2,9 +2,10 @@
 Phase 4: LLM Reasoning & Question Generation
 Use LLM to understand project and generate intelligent interview questions
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from pydantic import BaseModel
 from groq import Groq
+import orjson
 from loguru import logger
 from config import settings
 
@@ -105,8 +106,7 @@ Return the analysis in JSON format with these keys:
                 content = content.split("```json")[-1] if "```json" in content else content.split("```")[-1]
                 content = content.split("```")[0].strip()
             
-            import json
-            summary_dict = json.loads(content)
+            summary_dict = orjson.loads(content)
             
             return ProjectSummary(**summary_dict)
             
@@ -210,8 +210,7 @@ Return as JSON array with objects containing:
                 content = content.split("```json")[-1] if "```json" in content else content.split("```")[-1]
                 content = content.split("```")[0].strip()
             
-            import json
-            data = json.loads(content)
+            data = orjson.loads(content)
             
             # Extract questions array (handle different response formats)
             # Check if data is already a list/array
@@ -306,6 +305,22 @@ Return as JSON array with objects containing:
         These questions will be the same for all candidates applying to this job.
         They focus on role requirements, skills, and general technical knowledge.
         """
+        questions, _ = self.generate_jd_questions_with_fallback_flag(
+            job_description, role_type, required_skills, preferred_skills
+        )
+        return questions
+    
+    def generate_jd_questions_with_fallback_flag(
+        self,
+        job_description: str,
+        role_type: str,
+        required_skills: List[str],
+        preferred_skills: List[str] = None
+    ) -> Tuple[List[InterviewQuestion], bool]:
+        """
+        Same as generate_questions_from_job_description, plus whether any
+        template fallback questions were used (LLM failure or short response)
+        """
         
         preferred_skills = preferred_skills or []
         
@@ -384,8 +399,7 @@ Return as JSON array with EXACTLY 10 objects containing:
                 content = content.split("```json")[-1] if "```json" in content else content.split("```")[-1]
                 content = content.split("```")[0].strip()
             
-            import json
-            data = json.loads(content)
+            data = orjson.loads(content)
             
             # Extract questions array
             if isinstance(data, list):
@@ -404,17 +418,18 @@ Return as JSON array with EXACTLY 10 objects containing:
                     continue
             
             # Ensure we have exactly 10 questions
-            if len(questions) < 10:
+            used_fallback = len(questions) < 10
+            if used_fallback:
                 logger.warning(f"Only generated {len(questions)} questions, adding fallback questions")
                 questions.extend(self._generate_fallback_jd_questions(role_type, required_skills)[len(questions):10])
             
             logger.success(f"Generated {len(questions)} JD-based interview questions")
-            return questions[:10]  # Return exactly 10 questions
+            return questions[:10], used_fallback  # Return exactly 10 questions
             
         except Exception as e:
             logger.error(f"Error generating JD questions: {e}")
             # Return fallback questions
-            return self._generate_fallback_jd_questions(role_type, required_skills)
+            return self._generate_fallback_jd_questions(role_type, required_skills), True
     
     def _generate_fallback_jd_questions(self, role_type: str, required_skills: List[str]) -> List[InterviewQuestion]:
         """Generate fallback JD-based questions if LLM fails"""
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 from groq import Groq
 from loguru import logger
 from config import settings
-import json
+import orjson
 
 
 class DimensionalScore(BaseModel):
@@ -107,7 +107,7 @@ Return JSON with:
                 content = content.split("```json")[-1] if "```json" in content else content.split("```")[-1]
                 content = content.split("```")[0].strip()
             
-            result = json.loads(content)
+            result = orjson.loads(content)
             return DimensionalScore(**result)
             
         except Exception as e:
@@ -170,7 +170,7 @@ Return JSON with:
                 # Remove markdown code block markers
                 content = content.replace("```json", "").replace("```", "").strip()
             
-            result = json.loads(content)
+            result = orjson.loads(content)
             return (
                 result.get('feedback', 'Good effort'),
                 result.get('strengths', ['Shows understanding']),
@@ -257,7 +257,7 @@ Return JSON:
                 content = content.split("```json")[-1] if "```json" in content else content.split("```")[-1]
                 content = content.split("```")[0].strip()
             
-            result = json.loads(content)
+            result = orjson.loads(content)
             return result.get('is_fraud', False), result.get('reason', '')
             
         except:
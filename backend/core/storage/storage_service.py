@@ -264,15 +264,14 @@ class StorageService:
         if not os.path.exists(repos_dir):
             return
         
-        current_time = time.time()
+        cutoff = time.time() - max_age_hours * 3600
         
-        for item in os.listdir(repos_dir):
-            item_path = os.path.join(repos_dir, item)
-            if os.path.isdir(item_path):
-                item_age_hours = (current_time - os.path.getmtime(item_path)) / 3600
-                if item_age_hours > max_age_hours:
-                    logger.info(f"Cleaning up old repository: {item}")
-                    shutil.rmtree(item_path)
+        # scandir entries carry the file type, so only the mtime needs a stat call
+        with os.scandir(repos_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    logger.info(f"Cleaning up old repository: {entry.name}")
+                    shutil.rmtree(entry.path)
 
 
 # Factory function to create storage service with config
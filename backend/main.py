@@ -2,19 +2,24 @@
 Main FastAPI Application - AURA Skill Verification Agent
 Integrates all phases into a cohesive API
 """
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
+from sqlalchemy import select, insert, update, delete, bindparam, func, text
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, field_validator
+from datetime import datetime, timezone
+import asyncio
 import os
+import anyio
+from concurrent.futures import ThreadPoolExecutor
 
 from config import settings
-from models import get_db, init_db
+from models import get_db, init_db, warm_pool, SessionLocal, engine
 from models.database import Candidate, Repository, Question, QuestionScore, Evaluation, RoleProfile, JobDescription
-from models.multi_tenant import Internship, Application
+from models.multi_tenant import Application
 
 # Import phase services
 from core.phase0_profiles.role_profiles import RoleProfileManager
@@ -40,7 +45,8 @@ from loguru import logger
 app = FastAPI(
     title="AURA - Automated Understanding & Role Assessment",
     description="AI-powered skill verification system for technical candidates",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -52,6 +58,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (reports, candidate lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Register new routers for multi-tenant features
 app.include_router(company_router)
 app.include_router(student_router)
@@ -60,32 +69,40 @@ app.include_router(student_router)
 @app.on_event("startup")
 async def startup_event():
     init_db()
+    warm_pool()
+    # Sync handlers each hold a pooled connection on a threadpool thread. Size the threadpool
+    # to the pool's capacity so excess requests queue for a thread instead of timing out on
+    # pool_timeout while holding one
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW
+    )
     logger.info("AURA system started successfully")
 
 
 # ============ Health Check Endpoint ============
 
 @app.get("/health")
-async def health_check():
+def health_check():
     """Health check endpoint for monitoring and load balancers"""
+    timestamp = datetime.now(timezone.utc)
     try:
-        # Quick database connection check
-        db = next(get_db())
-        db.execute("SELECT 1")
-        db.close()
+        # Quick database connection check - the session is closed even if the query fails
+        with SessionLocal() as db:
+            db.execute(text("SELECT 1"))
         
         return {
             "status": "healthy",
             "service": "AURA",
-            "timestamp": datetime.utcnow().isoformat(),
-            "database": "connected"
+            "timestamp": timestamp,
+            "database": "connected",
+            "database_pool": engine.pool.status()  # checked-out count exposes session leaks
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         return {
             "status": "unhealthy",
             "service": "AURA",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "database": "disconnected",
             "error": str(e)
         }
@@ -96,7 +113,7 @@ async def get_storage_status():
     """Get current cloud storage configuration and status"""
     try:
         status = github_service.get_storage_status()
-        status["timestamp"] = datetime.utcnow().isoformat()
+        status["timestamp"] = datetime.now(timezone.utc)
         
         # Add helpful messages
         if status["cloud_storage_enabled"]:
@@ -150,7 +167,110 @@ class EvaluationResponse(BaseModel):
     report_pdf_path: Optional[str] = None
 
 
+class CandidateListItem(BaseModel):
+    id: int
+    name: str
+    email: str
+    github_url: Optional[str] = None
+    role_type: str
+    status: str
+    created_at: Optional[datetime] = None
+
+
+class CandidateListResponse(BaseModel):
+    items: List[CandidateListItem]
+    total: int
+    page: int
+    pages: int
+
+
+class CandidateStatusResponse(BaseModel):
+    status: str
+    total_questions: Optional[int] = None
+    answered_questions: Optional[int] = None
+    message: Optional[str] = None
+
+
+class ReportCandidate(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    name: str
+    email: str
+    role_type: str
+    github_url: Optional[str] = None
+
+
+class ReportRepository(BaseModel):
+    name: str
+    url: Optional[str] = None
+    tech_stack: Optional[List[str]] = None
+    languages: Optional[Any] = None  # {language: bytes} from GitHub, [] when unknown
+
+
+class ReportQuestion(BaseModel):
+    question_id: int
+    question_text: str
+    question_type: Optional[str] = None
+    difficulty: Optional[str] = None
+    context: Optional[str] = None
+
+
+class ReportAnswer(BaseModel):
+    id: int
+    question_id: int
+    answer_text: str
+    time_taken: int
+
+
+class ReportQuestionScore(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    question_id: int
+    concept_understanding: Optional[float] = None
+    technical_depth: Optional[float] = None
+    accuracy: Optional[float] = None
+    communication: Optional[float] = None
+    relevance: Optional[float] = None
+    weighted_score: Optional[float] = None
+    feedback: Optional[str] = None
+    strengths: Optional[List[str]] = None
+    weaknesses: Optional[List[str]] = None
+    fraud_flag: bool = False
+    fraud_reason: Optional[str] = None
+    
+    @field_validator("fraud_flag", mode="before")
+    @classmethod
+    def default_fraud_flag(cls, v):
+        return bool(v)
+
+
+class ReportFinalScore(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    overall_score: Optional[float] = None
+    understanding_score: Optional[float] = None
+    reasoning_score: Optional[float] = None
+    communication_score: Optional[float] = None
+    logic_score: Optional[float] = None
+    hire_recommendation: Optional[str] = None
+    confidence: Optional[float] = None
+
+
+class ReportResponse(BaseModel):
+    candidate: ReportCandidate
+    repository: ReportRepository
+    questions: List[ReportQuestion]
+    answers: List[ReportAnswer]
+    question_scores: List[ReportQuestionScore]
+    final_score: ReportFinalScore
+    report_pdf_path: Optional[str] = None
+
+
 # ============ API Endpoints ============
+# Endpoints that touch the database (or GitHub) are plain `def` so FastAPI runs
+# them in its threadpool; the sync SQLAlchemy session would otherwise block the event loop.
 
 @app.get("/")
 async def root():
@@ -171,54 +291,59 @@ async def get_roles():
     }
 
 
-@app.get("/api/candidates")
-async def list_candidates(db: Session = Depends(get_db)):
-    """List all candidates"""
-    candidates = db.query(Candidate).all()
+@app.get("/api/candidates", response_model=CandidateListResponse, response_model_exclude_none=True)
+def list_candidates(
+    db: Session = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+    role: Optional[str] = None
+):
+    """List candidates, one page at a time"""
+    filters = [Candidate.role_type == role] if role else []
+    # Only the listed columns - no ORM entities to hydrate
+    rows = db.query(
+        Candidate.id,
+        Candidate.name,
+        Candidate.email,
+        Candidate.github_url,
+        Candidate.role_type,
+        Candidate.status,
+        Candidate.created_at,
+        Repository.repo_url
+    ).outerjoin(
+        Repository, Repository.candidate_id == Candidate.id
+    ).filter(*filters).order_by(Candidate.id).offset(skip).limit(limit).all()
+    total = db.query(func.count(Candidate.id)).filter(*filters).scalar()
     
-    result = []
-    for c in candidates:
-        # Determine status based on related data
-        has_questions = db.query(Question).filter(Question.candidate_id == c.id).first() is not None
-        has_evaluation = db.query(Evaluation).filter(Evaluation.candidate_id == c.id).first() is not None
-        
-        if has_evaluation:
-            status = "completed"
-        elif has_questions:
-            status = "questions_ready"
-        else:
-            status = "processing"
-        
-        # Get repository info
-        repo = db.query(Repository).filter(Repository.candidate_id == c.id).first()
-        github_url = repo.repo_url if repo else c.github_url
-        
-        result.append({
-            "id": c.id,
-            "name": c.name,
-            "email": c.email,
-            "github_url": github_url,
-            "role_type": c.role_type,
-            "status": status,
-            "created_at": str(c.created_at)
-        })
+    result = [
+        CandidateListItem(
+            id=row.id,
+            name=row.name,
+            email=row.email,
+            github_url=row.repo_url or row.github_url,
+            role_type=row.role_type,
+            status=row.status,
+            created_at=row.created_at
+        )
+        for row in rows
+    ]
     
-    return {"items": result, "total": len(result)}
+    return CandidateListResponse(
+        items=result,
+        total=total,
+        page=skip // limit + 1,
+        pages=(total + limit - 1) // limit
+    )
 
 
 @app.delete("/api/candidate/{candidate_id}")
-async def delete_candidate(candidate_id: int, db: Session = Depends(get_db)):
+def delete_candidate(candidate_id: int, db: Session = Depends(get_db)):
     """Delete a candidate and all related data"""
     candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    # Delete related data
-    db.query(Question).filter(Question.candidate_id == candidate_id).delete()
-    db.query(Repository).filter(Repository.candidate_id == candidate_id).delete()
-    db.query(Evaluation).filter(Evaluation.candidate_id == candidate_id).delete()
-    
-    # Delete candidate
+    # Delete candidate - questions, scores, repository and evaluation cascade in the same transaction
     db.delete(candidate)
     db.commit()
     
@@ -241,7 +366,7 @@ async def get_role_skills(role_type: str):
 
 
 @app.post("/api/candidate/submit", response_model=CandidateSubmitResponse)
-async def submit_candidate(
+def submit_candidate(
     candidate_input: CandidateInput,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
@@ -253,33 +378,22 @@ async def submit_candidate(
     try:
         logger.info(f"Processing candidate: {candidate_input.name}")
         
-        # Validate GitHub URL
-        if not github_service.validate_repository(candidate_input.github_url):
-            raise HTTPException(status_code=400, detail="Invalid or inaccessible GitHub repository")
-        
         # Check if candidate with this email already exists
         existing_candidate = db.query(Candidate).filter(Candidate.email == candidate_input.email).first()
         if existing_candidate:
             logger.info(f"Candidate with email {candidate_input.email} already exists (ID: {existing_candidate.id})")
             
-            # Determine status based on related data
-            has_questions = db.query(Question).filter(Question.candidate_id == existing_candidate.id).first() is not None
-            has_evaluation = db.query(Evaluation).filter(Evaluation.candidate_id == existing_candidate.id).first() is not None
-            
-            if has_evaluation:
-                status = "completed"
-            elif has_questions:
-                status = "questions_ready"
-            else:
-                status = "processing"
-            
             # Return existing candidate instead of creating duplicate
             return CandidateSubmitResponse(
                 candidate_id=existing_candidate.id,
                 message="Candidate already exists. Using existing record.",
-                status=status
+                status=existing_candidate.status
             )
         
+        # Validate GitHub URL (only for new candidates - avoids a GitHub API call on resubmission)
+        if not github_service.validate_repository(candidate_input.github_url):
+            raise HTTPException(status_code=400, detail="Invalid or inaccessible GitHub repository")
+        
         # Create candidate in database
         candidate = Candidate(
             name=candidate_input.name,
@@ -306,11 +420,34 @@ async def submit_candidate(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _read_text_file(path: str) -> str:
+    """Read a text file, ignoring undecodable bytes"""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
+
+
+# Repository jobs (clone, parse, LLM) and answer evaluations (LLM scoring per answer) are
+# long blocking work. They run on their own bounded pool so they neither stall the event
+# loop nor occupy the request threadpool; jobs beyond REPO_PROCESSING_WORKERS wait in the
+# executor's queue
+_repository_executor = ThreadPoolExecutor(
+    max_workers=settings.REPO_PROCESSING_WORKERS, thread_name_prefix="repo-job"
+)
+
+
 async def process_repository(candidate_id: int, github_url: str, role_type: str):
     """
     Background task to process repository through all phases
+    Hands the job to the repository executor and returns once it finishes
     """
-    db = next(get_db())
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_repository_executor, _process_repository, candidate_id, github_url, role_type)
+
+
+def _process_repository(candidate_id: int, github_url: str, role_type: str):
+    """Process a repository through all phases (runs on the repository executor)"""
+    # Own session, closed in the finally below (not the request-scoped get_db generator)
+    db = SessionLocal()
     
     try:
         logger.info(f"Starting repository processing for candidate {candidate_id}")
@@ -339,9 +476,10 @@ async def process_repository(candidate_id: int, github_url: str, role_type: str)
         parser = CodeParser()
         
         # Update repository with analysis
-        tech_stack_list = list(project_structure.get('languages', {}).keys())
-        repository.tech_stack = tech_stack_list  # Store as list, not dict
-        repository.file_structure = {"total_files": project_structure.get('total_files', 0)}
+        tech_stack = list(project_structure.get('languages', {}).keys())
+        total_files = project_structure.get('total_files', 0)
+        repository.tech_stack = tech_stack  # Store as list, not dict
+        repository.file_structure = {"total_files": total_files}
         
         # Parse key files (simplified)
         file_analyses = project_structure.get('files', [])[:10]
@@ -355,13 +493,12 @@ async def process_repository(candidate_id: int, github_url: str, role_type: str)
         readme_paths = [os.path.join(local_path, 'README.md'), os.path.join(local_path, 'readme.md')]
         for rp in readme_paths:
             if os.path.exists(rp):
-                with open(rp, 'r', encoding='utf-8', errors='ignore') as f:
-                    readme_content = f.read()
+                readme_content = _read_text_file(rp)
                 break
         
         # Simple project summary when no LLM available
-        tech_stack = list(project_structure.get('languages', {}).keys())
-        project_summary_text = f"Repository: {github_url}\nLanguages: {', '.join(tech_stack)}\nFiles: {project_structure.get('total_files', 0)}"
+        tech_csv = ", ".join(tech_stack)
+        project_summary_text = f"Repository: {github_url}\nLanguages: {tech_csv}\nFiles: {total_files}"
         
         # Update repository with summary
         repository.project_summary = project_summary_text
@@ -370,7 +507,7 @@ async def process_repository(candidate_id: int, github_url: str, role_type: str)
         db.commit()
         
         # Generate interview questions (will use GitHub-based since no application_id provided)
-        await generate_questions_for_candidate(candidate_id, application_id=None, db=db)
+        generate_questions_for_candidate(candidate_id, application_id=None, db=db)
         
         logger.success(f"Repository processing complete for candidate {candidate_id}")
         
@@ -381,28 +518,30 @@ async def process_repository(candidate_id: int, github_url: str, role_type: str)
         db.close()
 
 
-@app.get("/api/candidate/{candidate_id}/status")
-async def get_candidate_status(candidate_id: int, db: Session = Depends(get_db)):
+@app.get("/api/candidate/{candidate_id}/status", response_model=CandidateStatusResponse, response_model_exclude_none=True)
+def get_candidate_status(candidate_id: int, db: Session = Depends(get_db)):
     """Get processing status of candidate"""
     candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    questions = db.query(Question).filter(Question.candidate_id == candidate_id).all()
+    # One aggregate row instead of loading every question; NULLIF keeps blank answers uncounted
+    total, answered = db.query(
+        func.count(Question.id), func.count(func.nullif(Question.answer_text, ""))
+    ).filter(Question.candidate_id == candidate_id).one()
     
-    if questions:
-        answered = sum(1 for q in questions if q.answer_text)
-        return {
-            "status": "completed" if answered == len(questions) else "ready",
-            "total_questions": len(questions),
-            "answered_questions": answered
-        }
+    if total:
+        return CandidateStatusResponse(
+            status=candidate.status,
+            total_questions=total,
+            answered_questions=answered
+        )
     else:
-        return {"status": "processing", "message": "Analysis in progress"}
+        return CandidateStatusResponse(status=candidate.status, message="Analysis in progress")
 
 
 @app.get("/api/candidate/{candidate_id}/questions", response_model=List[QuestionResponse])
-async def get_questions(candidate_id: int, db: Session = Depends(get_db)):
+def get_questions(candidate_id: int, db: Session = Depends(get_db)):
     """
     Phase 5: Get interview questions for candidate
     Returns either JD-based or GitHub-based questions
@@ -424,7 +563,7 @@ async def get_questions(candidate_id: int, db: Session = Depends(get_db)):
     ]
 
 
-async def generate_questions_for_candidate(candidate_id: int, application_id: Optional[int] = None, db: Session = None):
+def generate_questions_for_candidate(candidate_id: int, application_id: Optional[int] = None, db: Session = None):
     """
     Helper function to generate questions for a candidate
     Uses JD questions if application uses JD, otherwise generates from GitHub project
@@ -438,9 +577,10 @@ async def generate_questions_for_candidate(candidate_id: int, application_id: Op
     job_description = None
     
     if application_id:
+        # Internship comes back joined with the application
         application = db.query(Application).filter(Application.id == application_id).first()
         if application:
-            internship = db.query(Internship).filter(Internship.id == application.internship_id).first()
+            internship = application.internship
             if internship and internship.use_jd_questions:
                 job_description = db.query(JobDescription).filter(
                     JobDescription.internship_id == internship.id,
@@ -452,19 +592,22 @@ async def generate_questions_for_candidate(candidate_id: int, application_id: Op
         # Use pre-generated JD questions
         logger.info(f"Using JD questions for candidate {candidate_id}")
         
-        for q_data in job_description.questions_data:
-            question = Question(
-                candidate_id=candidate_id,
-                job_description_id=job_description.id,
-                question_text=q_data['question_text'],
-                question_type=q_data['question_type'],
-                difficulty=q_data['difficulty'],
-                context=q_data['context'],
-                expected_keywords=q_data['expected_keywords'],
-                source='jd'
-            )
-            db.add(question)
+        # One executemany INSERT for all questions
+        db.execute(insert(Question), [
+            {
+                "candidate_id": candidate_id,
+                "job_description_id": job_description.id,
+                "question_text": q_data['question_text'],
+                "question_type": q_data['question_type'],
+                "difficulty": q_data['difficulty'],
+                "context": q_data['context'],
+                "expected_keywords": q_data['expected_keywords'],
+                "source": 'jd'
+            }
+            for q_data in job_description.questions_data
+        ])
         
+        candidate.status = "questions_ready"
         db.commit()
         logger.success(f"Added {len(job_description.questions_data)} JD questions for candidate {candidate_id}")
         
@@ -472,14 +615,13 @@ async def generate_questions_for_candidate(candidate_id: int, application_id: Op
         # Generate questions from GitHub repository (existing logic)
         logger.info(f"Generating GitHub-based questions for candidate {candidate_id}")
         
-        repository = db.query(Repository).filter(Repository.candidate_id == candidate_id).first()
+        repository = candidate.repository
         if not repository:
             raise ValueError(f"No repository found for candidate {candidate_id}")
         
         # Get role profile
         role_type = candidate.role_type
-        role_profile = RoleProfileManager.get_profile(role_type)
-        required_skills = role_profile.get("required_skills", [])
+        required_skills = RoleProfileManager.get_required_skills(role_type)
         
         # Prepare project summary
         from core.phase4_llm.llm_service import ProjectSummary
@@ -510,25 +652,28 @@ async def generate_questions_for_candidate(candidate_id: int, application_id: Op
             required_skills=required_skills
         )
         
-        # Save questions to database
-        for q in questions_list:
-            question = Question(
-                candidate_id=candidate_id,
-                question_text=q.question_text,
-                question_type=q.question_type,
-                difficulty=q.difficulty,
-                context=q.context,
-                expected_keywords=q.expected_keywords,
-                source='github'
-            )
-            db.add(question)
+        # Save questions to database with one executemany INSERT
+        if questions_list:
+            db.execute(insert(Question), [
+                {
+                    "candidate_id": candidate_id,
+                    "question_text": q.question_text,
+                    "question_type": q.question_type,
+                    "difficulty": q.difficulty,
+                    "context": q.context,
+                    "expected_keywords": q.expected_keywords,
+                    "source": 'github'
+                }
+                for q in questions_list
+            ])
         
+        candidate.status = "questions_ready"
         db.commit()
         logger.success(f"Generated {len(questions_list)} GitHub questions for candidate {candidate_id}")
 
 
 @app.post("/api/candidate/{candidate_id}/answers")
-async def submit_answers(
+def submit_answers(
     candidate_id: int,
     answers_data: AnswersSubmit,
     background_tasks: BackgroundTasks,
@@ -541,13 +686,36 @@ async def submit_answers(
     try:
         logger.info(f"Received {len(answers_data.answers)} answers for candidate {candidate_id}")
         
-        # Save answers
-        for answer in answers_data.answers:
-            question = db.query(Question).filter(Question.id == answer.question_id).first()
-            if question and question.candidate_id == candidate_id:
-                question.answer_text = answer.answer_text
-                question.time_taken = answer.time_taken
-                question.answered_at = datetime.utcnow()
+        # Save answers - validate ownership in one SELECT, then one batched UPDATE
+        answers_by_id = {answer.question_id: answer for answer in answers_data.answers}
+        owned_ids = {
+            question_id for (question_id,) in db.query(Question.id).filter(
+                Question.id.in_(answers_by_id.keys()),
+                Question.candidate_id == candidate_id
+            )
+        }
+        
+        params = [
+            {
+                "b_id": question_id,
+                "b_answer_text": answer.answer_text,
+                "b_time_taken": answer.time_taken
+            }
+            for question_id, answer in answers_by_id.items()
+            if question_id in owned_ids
+        ]
+        if params:
+            questions_table = Question.__table__
+            db.execute(
+                update(questions_table)
+                .where(questions_table.c.id == bindparam("b_id"))
+                .values(
+                    answer_text=bindparam("b_answer_text"),
+                    time_taken=bindparam("b_time_taken"),
+                    answered_at=func.now()
+                ),
+                params
+            )
         
         db.commit()
         
@@ -564,25 +732,40 @@ async def submit_answers(
 async def evaluate_candidate(candidate_id: int):
     """
     Phase 6 & 7: Evaluate answers and generate report
+    Per-answer LLM scoring blocks for tens of seconds - hands the job to the
+    background executor and returns once it finishes
     """
-    db = next(get_db())
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_repository_executor, _evaluate_candidate, candidate_id)
+
+
+def _evaluate_candidate(candidate_id: int):
+    """Evaluate a candidate's answers and generate the report (runs on the background executor)"""
+    # Own session, closed in the finally below (not the request-scoped get_db generator)
+    db = SessionLocal()
     
     try:
         logger.info(f"Starting evaluation for candidate {candidate_id}")
         
         candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
-        repository = db.query(Repository).filter(Repository.candidate_id == candidate_id).first()
+        repository = candidate.repository
         questions = db.query(Question).filter(Question.candidate_id == candidate_id).all()
         
         # Delete existing question scores to avoid UNIQUE constraint errors
-        question_ids = [q.id for q in questions]
-        db.query(QuestionScore).filter(QuestionScore.question_id.in_(question_ids)).delete(synchronize_session=False)
+        deleted = db.execute(
+            delete(QuestionScore)
+            .where(QuestionScore.question_id.in_(
+                select(Question.id).where(Question.candidate_id == candidate_id)
+            ))
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
-        logger.info(f"Deleted existing scores for {len(question_ids)} questions")
+        logger.info(f"Deleted {deleted.rowcount} existing question scores")
         
         question_evaluations = []
-        all_strengths = []
-        all_weaknesses = []
+        score_rows = []
+        all_strengths = set()
+        all_weaknesses = set()
         fraud_signals = []
         
         # Evaluate each question
@@ -629,25 +812,24 @@ async def evaluate_candidate(candidate_id: int):
             # Calculate weighted score
             weighted_score = evaluation_service.calculate_weighted_score(scores)
             
-            # Save scores
-            question_score = QuestionScore(
-                question_id=question.id,
-                concept_understanding=scores.concept_understanding,
-                technical_depth=scores.technical_depth,
-                accuracy=scores.accuracy,
-                communication=scores.communication,
-                relevance=scores.relevance,
-                weighted_score=weighted_score,
-                feedback=feedback,
-                strengths=strengths,
-                weaknesses=weaknesses,
-                fraud_flag=is_fraud,
-                fraud_reason=fraud_reason if is_fraud else None
-            )
-            db.add(question_score)
+            # Collect scores - saved in one batch after the loop
+            score_rows.append({
+                "question_id": question.id,
+                "concept_understanding": scores.concept_understanding,
+                "technical_depth": scores.technical_depth,
+                "accuracy": scores.accuracy,
+                "communication": scores.communication,
+                "relevance": scores.relevance,
+                "weighted_score": weighted_score,
+                "feedback": feedback,
+                "strengths": strengths,
+                "weaknesses": weaknesses,
+                "fraud_flag": is_fraud,
+                "fraud_reason": fraud_reason if is_fraud else None
+            })
             
-            all_strengths.extend(strengths)
-            all_weaknesses.extend(weaknesses)
+            all_strengths.update(strengths)
+            all_weaknesses.update(weaknesses)
             
             question_evaluations.append({
                 'question': question.question_text,
@@ -658,30 +840,29 @@ async def evaluate_candidate(candidate_id: int):
                 'feedback': feedback
             })
         
+        if score_rows:
+            db.execute(insert(QuestionScore), score_rows)
         db.commit()
         
-        # Calculate overall scores
-        question_eval_objects = [db.query(QuestionScore).filter(QuestionScore.question_id == q.id).first() for q in questions]
-        question_eval_objects = [qe for qe in question_eval_objects if qe]
-        
+        # Calculate overall scores from the rows just saved (no re-query per question)
         from core.phase6_evaluation.evaluation_service import QuestionEvaluation, DimensionalScore
         eval_list = [
             QuestionEvaluation(
-                question_id=qe.question_id,
+                question_id=row["question_id"],
                 scores=DimensionalScore(
-                    concept_understanding=qe.concept_understanding,
-                    technical_depth=qe.technical_depth,
-                    accuracy=qe.accuracy,
-                    communication=qe.communication,
-                    relevance=qe.relevance
+                    concept_understanding=row["concept_understanding"],
+                    technical_depth=row["technical_depth"],
+                    accuracy=row["accuracy"],
+                    communication=row["communication"],
+                    relevance=row["relevance"]
                 ),
-                weighted_score=qe.weighted_score,
-                feedback=qe.feedback,
-                strengths=qe.strengths,
-                weaknesses=qe.weaknesses,
-                fraud_flag=qe.fraud_flag
+                weighted_score=row["weighted_score"],
+                feedback=row["feedback"],
+                strengths=row["strengths"],
+                weaknesses=row["weaknesses"],
+                fraud_flag=row["fraud_flag"]
             )
-            for qe in question_eval_objects
+            for row in score_rows
         ]
         
         overall_scores = OverallEvaluator.calculate_overall_score(eval_list)
@@ -695,8 +876,8 @@ async def evaluate_candidate(candidate_id: int):
             reasoning_score=overall_scores['reasoning_score'],
             communication_score=overall_scores['communication_score'],
             logic_score=overall_scores['logic_score'],
-            strengths=list(set(all_strengths)),
-            weaknesses=list(set(all_weaknesses)),
+            strengths=list(all_strengths),
+            weaknesses=list(all_weaknesses),
             recommendations=f"Based on the evaluation, this candidate demonstrates {hire_rec.replace('_', ' ')} fit for the {candidate.role_type} role.",
             hire_recommendation=hire_rec,
             confidence=confidence,
@@ -704,6 +885,7 @@ async def evaluate_candidate(candidate_id: int):
             fraud_signals=fraud_signals if fraud_signals else None
         )
         db.add(evaluation)
+        candidate.status = "completed"
         db.commit()
         
         # Phase 7: Generate report
@@ -735,7 +917,7 @@ async def evaluate_candidate(candidate_id: int):
         
         report_paths = report_generator.generate_reports(report_data, candidate_id)
         evaluation.report_path = report_paths['pdf']
-        evaluation.report_generated_at = datetime.utcnow()
+        evaluation.report_generated_at = func.now()
         db.commit()
         
         logger.success(f"Evaluation complete for candidate {candidate_id}")
@@ -747,100 +929,65 @@ async def evaluate_candidate(candidate_id: int):
         db.close()
 
 
-@app.get("/api/candidate/{candidate_id}/report")
-async def get_report(candidate_id: int, db: Session = Depends(get_db)):
+@app.get("/api/candidate/{candidate_id}/report", response_model=ReportResponse, response_model_exclude_none=True)
+def get_report(candidate_id: int, db: Session = Depends(get_db)):
     """
     Phase 7: Get evaluation report with complete data
     """
-    # Get evaluation
-    evaluation = db.query(Evaluation).filter(Evaluation.candidate_id == candidate_id).first()
+    # Get candidate - evaluation and repository analysis are selectin-loaded with it
+    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    evaluation = candidate.evaluation if candidate else None
     if not evaluation:
         raise HTTPException(status_code=404, detail="Evaluation not yet complete")
     
-    # Get candidate
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
-    if not candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
-    
-    # Get repository analysis
-    repo_analysis = db.query(Repository).filter(Repository.candidate_id == candidate_id).first()
+    repo_analysis = candidate.repository
     
     # Get questions and scores
     questions = db.query(Question).filter(Question.candidate_id == candidate_id).all()
     scores = db.query(QuestionScore).join(Question).filter(Question.candidate_id == candidate_id).all()
     
     # Build repository data
-    repo_data = {
-        "name": repo_analysis.repo_name if repo_analysis else "Unknown",
-        "url": candidate.github_url,
-        "tech_stack": repo_analysis.tech_stack if repo_analysis else [],
-        "languages": repo_analysis.languages if repo_analysis else []
-    }
+    repo_data = ReportRepository(
+        name=repo_analysis.repo_name if repo_analysis else "Unknown",
+        url=candidate.github_url,
+        tech_stack=repo_analysis.tech_stack if repo_analysis else [],
+        languages=repo_analysis.languages if repo_analysis else []
+    )
     
     # Build response
-    return {
-        "candidate": {
-            "id": candidate.id,
-            "name": candidate.name,
-            "email": candidate.email,
-            "role_type": candidate.role_type,
-            "github_url": candidate.github_url
-        },
-        "repository": repo_data,
-        "questions": [
-            {
-                "question_id": q.id,
-                "question_text": q.question_text,
-                "question_type": q.question_type,
-                "difficulty": q.difficulty,
-                "context": q.context
-            }
+    return ReportResponse(
+        candidate=ReportCandidate.model_validate(candidate),
+        repository=repo_data,
+        questions=[
+            ReportQuestion(
+                question_id=q.id,
+                question_text=q.question_text,
+                question_type=q.question_type,
+                difficulty=q.difficulty,
+                context=q.context
+            )
             for q in questions
         ],
-        "answers": [
-            {
-                "id": q.id,
-                "question_id": q.id,
-                "answer_text": q.answer_text or "",
-                "time_taken": q.time_taken or 0
-            }
+        answers=[
+            ReportAnswer(
+                id=q.id,
+                question_id=q.id,
+                answer_text=q.answer_text or "",
+                time_taken=q.time_taken or 0
+            )
             for q in questions if q.answer_text
         ],
-        "question_scores": [
-            {
-                "id": s.id,
-                "question_id": s.question_id,
-                "concept_understanding": s.concept_understanding,
-                "technical_depth": s.technical_depth,
-                "accuracy": s.accuracy,
-                "communication": s.communication,
-                "relevance": s.relevance,
-                "weighted_score": s.weighted_score,
-                "feedback": s.feedback,
-                "strengths": s.strengths,
-                "weaknesses": s.weaknesses,
-                "fraud_flag": s.fraud_flag or False,
-                "fraud_reason": s.fraud_reason
-            }
-            for s in scores
-        ],
-        "final_score": {
-            "overall_score": evaluation.overall_score,
-            "understanding_score": evaluation.understanding_score,
-            "reasoning_score": evaluation.reasoning_score,
-            "communication_score": evaluation.communication_score,
-            "logic_score": evaluation.logic_score,
-            "hire_recommendation": evaluation.hire_recommendation,
-            "confidence": evaluation.confidence
-        },
-        "report_pdf_path": evaluation.report_path
-    }
+        question_scores=[ReportQuestionScore.model_validate(score) for score in scores],
+        final_score=ReportFinalScore.model_validate(evaluation),
+        report_pdf_path=evaluation.report_path
+    )
 
 
 @app.get("/api/candidate/{candidate_id}/report/download")
-async def download_report(candidate_id: int, db: Session = Depends(get_db)):
+def download_report(candidate_id: int, db: Session = Depends(get_db)):
     """Download PDF report"""
-    evaluation = db.query(Evaluation).filter(Evaluation.candidate_id == candidate_id).first()
+    # Only the report path is needed - skip hydrating the evaluation's JSON columns
+    evaluation = db.query(Evaluation.report_path).filter(Evaluation.candidate_id == candidate_id).first()
     
     if not evaluation or not evaluation.report_path:
         raise HTTPException(status_code=404, detail="Report not found")
@@ -863,40 +1010,54 @@ async def download_report(candidate_id: int, db: Session = Depends(get_db)):
 # ============ Recruiter Dashboard Endpoints ============
 
 @app.get("/api/recruiter/candidates")
-async def list_candidates(db: Session = Depends(get_db)):
+def list_candidates(db: Session = Depends(get_db)):
     """
     Phase 8: List all candidates for recruiter dashboard
     """
-    candidates = db.query(Candidate).all()
+    # Only the listed columns, evaluation fields via LEFT JOIN - no ORM entities to hydrate
+    rows = db.query(
+        Candidate.id,
+        Candidate.name,
+        Candidate.email,
+        Candidate.role_type,
+        Candidate.github_url,
+        Candidate.created_at,
+        Evaluation.id.label("evaluation_id"),
+        Evaluation.overall_score,
+        Evaluation.hire_recommendation
+    ).outerjoin(
+        Evaluation, Evaluation.candidate_id == Candidate.id
+    ).order_by(Candidate.id).execution_options(yield_per=1000)  # Server-side cursor, 1000 rows per fetch
     
-    results = []
-    for candidate in candidates:
-        evaluation = db.query(Evaluation).filter(Evaluation.candidate_id == candidate.id).first()
-        
-        results.append({
-            'id': candidate.id,
-            'name': candidate.name,
-            'email': candidate.email,
-            'role_type': candidate.role_type,
-            'github_url': candidate.github_url,
-            'created_at': candidate.created_at.isoformat(),
-            'overall_score': evaluation.overall_score if evaluation else None,
-            'hire_recommendation': evaluation.hire_recommendation if evaluation else None,
-            'status': 'evaluated' if evaluation else 'pending'
-        })
+    results = [
+        {
+            'id': row.id,
+            'name': row.name,
+            'email': row.email,
+            'role_type': row.role_type,
+            'github_url': row.github_url,
+            'created_at': row.created_at,
+            'overall_score': row.overall_score,
+            'hire_recommendation': row.hire_recommendation,
+            'status': 'evaluated' if row.evaluation_id is not None else 'pending'
+        }
+        for row in rows
+    ]
     
-    return {'candidates': results, 'total': len(results)}
+    # Returned directly so orjson serializes the rows (datetimes included)
+    # without the jsonable_encoder pass FastAPI runs on plain dicts
+    return ORJSONResponse({'candidates': results, 'total': len(results)})
 
 
 @app.get("/api/recruiter/candidate/{candidate_id}")
-async def get_candidate_details(candidate_id: int, db: Session = Depends(get_db)):
+def get_candidate_details(candidate_id: int, db: Session = Depends(get_db)):
     """Get detailed candidate information"""
     candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    repository = db.query(Repository).filter(Repository.candidate_id == candidate_id).first()
-    evaluation = db.query(Evaluation).filter(Evaluation.candidate_id == candidate_id).first()
+    repository = candidate.repository
+    evaluation = candidate.evaluation
     questions = db.query(Question).filter(Question.candidate_id == candidate_id).all()
     
     return {
@@ -931,4 +1092,12 @@ async def get_candidate_details(candidate_id: int, db: Session = Depends(get_db)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host=settings.HOST, port=settings.PORT)
+    # Import string is required for multiple workers; uvicorn[standard] picks
+    # uvloop/httptools automatically where available (not on Windows)
+    uvicorn.run(
+        "main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=settings.WORKERS,
+        access_log=settings.DEBUG
+    )
@@ -1,8 +1,10 @@
 """
 Database session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
+from loguru import logger
+import orjson
 from config import settings
 from models.database import Base
 
@@ -16,14 +18,29 @@ from models.multi_tenant import (
     UserRole, ApplicationStatus
 )
 
-# Create engine with connection pooling
+def _json_dumps(value) -> str:
+    """orjson-backed serializer for JSON columns - drivers expect str, orjson returns bytes"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Create engine with connection pooling - the single engine for the app,
+# sized from settings so every worker process shares the same configuration
 # Note: Neon pooler doesn't support statement_timeout in options
+# Safe behind a transaction-mode pooler (Neon pooler / PgBouncer): psycopg2 uses no
+# server-side prepared statements and the app sets no session state; pre-ping
+# catches connections the pooler has dropped
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=3600,   # Recycle connections after 1 hour
-    pool_size=5,         # Smaller pool for Neon's pooler
-    max_overflow=10,     # Allow extra connections if needed
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_use_lifo=True,  # Reuse hot connections, let idle ones age out
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,  # Skip recompiling repeated statements
+    # Every JSON column (questions_data, skills, strengths...) encodes/decodes with orjson
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {
         "connect_timeout": 10
     }
@@ -35,11 +52,40 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db():
     """Initialize database - create all tables"""
+    if not engine.dialect.supports_statement_cache:
+        logger.warning(
+            f"Database dialect {engine.dialect.name} does not support the SQL compilation cache; "
+            "every query will be recompiled"
+        )
     Base.metadata.create_all(bind=engine)
 
 
+def warm_pool(count: int = settings.DATABASE_POOL_WARMUP):
+    """
+    Open up to `count` pooled connections (each checked with SELECT 1) and return them
+    to the pool, so the first requests after startup don't each pay a new connection
+    """
+    connections = []
+    try:
+        for _ in range(min(count, settings.DATABASE_POOL_SIZE)):
+            conn = engine.connect()
+            connections.append(conn)
+            conn.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.warning(f"Connection pool warm-up stopped early: {e}")
+    finally:
+        for conn in connections:
+            conn.close()
+    logger.info(f"Warmed {len(connections)} database connection(s)")
+
+
 def get_db() -> Session:
-    """Get database session"""
+    """
+    Get database session (one per request via Depends)
+    FastAPI runs the teardown outside the threadpool limiter, so closing never
+    waits for a worker thread. Code outside a request should open SessionLocal()
+    itself and close it.
+    """
     db = SessionLocal()
     try:
         yield db
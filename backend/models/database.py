@@ -1,9 +1,9 @@
 """
 Database models for AURA system
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Text, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, Text, Boolean, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 
 Base = declarative_base()
@@ -18,13 +18,14 @@ class Candidate(Base):
     email = Column(String(255), unique=True, nullable=False, index=True)
     github_url = Column(String(500), nullable=False)
     role_type = Column(String(50), nullable=False)  # Frontend, Backend, ML, DevOps
+    status = Column(String(20), nullable=False, default="processing", index=True)  # processing, questions_ready, completed
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    repository = relationship("Repository", back_populates="candidate", uselist=False)
-    questions = relationship("Question", back_populates="candidate")
-    evaluation = relationship("Evaluation", back_populates="candidate", uselist=False)
+    repository = relationship("Repository", back_populates="candidate", uselist=False, cascade="all, delete-orphan", lazy="selectin")
+    questions = relationship("Question", back_populates="candidate", cascade="all, delete-orphan")
+    evaluation = relationship("Evaluation", back_populates="candidate", uselist=False, cascade="all, delete-orphan", lazy="selectin")
     application = relationship("Application", back_populates="candidate", uselist=False)
     
     def __repr__(self):
@@ -63,7 +64,7 @@ class Repository(Base):
     
     # Relationships
     candidate = relationship("Candidate", back_populates="repository")
-    modules = relationship("CodeModule", back_populates="repository")
+    modules = relationship("CodeModule", back_populates="repository", cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<Repository {self.repo_name}>"
@@ -103,6 +104,8 @@ class JobDescription(Base):
     __tablename__ = "job_descriptions"
     
     id = Column(Integer, primary_key=True, index=True)
+    # The UNIQUE index also serves the "internship_id = ? AND is_active" lookups:
+    # at most one row matches, so an (internship_id, is_active) index is never chosen
     internship_id = Column(Integer, ForeignKey("internships.id"), unique=True, nullable=False)
     
     # Job description details
@@ -129,7 +132,7 @@ class Question(Base):
     __tablename__ = "questions"
     
     id = Column(Integer, primary_key=True, index=True)
-    candidate_id = Column(Integer, ForeignKey("candidates.id"))
+    candidate_id = Column(Integer, ForeignKey("candidates.id"), index=True)
     job_description_id = Column(Integer, ForeignKey("job_descriptions.id"), nullable=True)
     
     question_text = Column(Text, nullable=False)
@@ -150,7 +153,7 @@ class Question(Base):
     
     # Relationships
     candidate = relationship("Candidate", back_populates="questions")
-    score = relationship("QuestionScore", back_populates="question", uselist=False)
+    score = relationship("QuestionScore", back_populates="question", uselist=False, cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<Question {self.id}: {self.question_type}>"
@@ -206,7 +209,7 @@ class Evaluation(Base):
     logic_score = Column(Float, default=0.0)
     
     # Skill breakdown
-    skill_scores = Column(JSON)  # {skill_name: score}
+    skill_scores = deferred(Column(JSON))  # {skill_name: score} - not read by any endpoint, load on access
     
     # Analysis
     strengths = Column(JSON)  # List of strength areas
@@ -219,7 +222,7 @@ class Evaluation(Base):
     
     # Fraud detection
     fraud_detected = Column(Boolean, default=False)
-    fraud_signals = Column(JSON)
+    fraud_signals = deferred(Column(JSON))
     
     # Report
     report_path = Column(String(500))
@@ -235,6 +238,12 @@ class Evaluation(Base):
         return f"<Evaluation {self.candidate_id}: {self.overall_score:.2f}>"
 
 
+# Recruiter rankings sort by score descending; the composite also covers the
+# join from applications so the score is read from the index
+Index("ix_eval_score_desc", Evaluation.overall_score.desc())
+Index("ix_eval_candidate_score", Evaluation.candidate_id, Evaluation.overall_score.desc())
+
+
 class RoleProfile(Base):
     """Role-specific skill profile"""
     __tablename__ = "role_profiles"
@@ -1,8 +1,8 @@
 """
 Multi-tenancy models for I-Intern integration
 """
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Index, Enum as SQLEnum
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 import enum
 
@@ -40,7 +40,7 @@ class User(Base):
     # User info
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=False)
-    role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.STUDENT)
+    role = Column(SQLEnum(UserRole, native_enum=True), nullable=False, default=UserRole.STUDENT)
     
     # Student-specific
     github_url = Column(String(500))
@@ -103,7 +103,7 @@ class Internship(Base):
     
     # Internship details
     title = Column(String(255), nullable=False)
-    description = Column(Text)
+    description = deferred(Column(Text))  # only detail views read it - they undefer() it
     role_type = Column(String(50), nullable=False)  # Frontend, Backend, ML, DevOps
     location = Column(String(255))
     duration_months = Column(Integer)
@@ -129,20 +129,24 @@ class Internship(Base):
         return f"<Internship {self.title} at {self.company.name if self.company else 'Unknown'}>"
 
 
+# Company dashboards list internships by company (and active flag)
+Index("ix_internship_company_active", Internship.company_id, Internship.is_active)
+
+
 class Application(Base):
     """Job application with AURA assessment"""
     __tablename__ = "applications"
     
     id = Column(Integer, primary_key=True, index=True)
     
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)  # indexed by ix_app_user_status
     internship_id = Column(Integer, ForeignKey("internships.id"), nullable=False)
     
     # I-Intern application ID
     i_intern_application_id = Column(String(255), unique=True, nullable=False, index=True)
     
     # Application status
-    status = Column(SQLEnum(ApplicationStatus), nullable=False, default=ApplicationStatus.PENDING)
+    status = Column(SQLEnum(ApplicationStatus, native_enum=True), nullable=False, default=ApplicationStatus.PENDING, index=True)
     
     # AURA assessment
     candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=True, unique=True)
@@ -157,8 +161,21 @@ class Application(Base):
     
     # Relationships
     user = relationship("User", back_populates="applications", foreign_keys=[user_id])
-    internship = relationship("Internship", back_populates="applications")
-    candidate = relationship("Candidate", back_populates="application", uselist=False)
+    # Many-to-one read on nearly every application response - JOIN it in rather than lazy-load per row
+    internship = relationship("Internship", back_populates="applications", lazy="joined")
+    candidate = relationship("Candidate", back_populates="application", uselist=False, lazy="selectin")
     
     def __repr__(self):
         return f"<Application {self.id}: {self.status}>"
+
+
+# Recruiter analytics filter by internship + status; rankings only look at completed assessments
+Index("ix_app_internship_status", Application.internship_id, Application.status)
+# Student pages filter by user (+ status for available AURA tests); also serves user_id alone
+Index("ix_app_user_status", Application.user_id, Application.status)
+Index(
+    "ix_app_aura_completed",
+    Application.internship_id,
+    postgresql_where=Application.aura_completed_at.isnot(None),
+    sqlite_where=Application.aura_completed_at.isnot(None)
+)
@@ -2,10 +2,16 @@
 Company/Recruiter portal API routes
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, contains_eager, selectinload, raiseload, undefer
+from sqlalchemy import Select, select, update, func, desc, event, inspect
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import time
+import threading
+import hashlib
+import base64
+import orjson
 from pydantic import BaseModel
 from loguru import logger
 
@@ -15,59 +21,183 @@ from models.multi_tenant import Company, Internship, Application, ApplicationSta
 from core.auth import require_recruiter, require_admin, require_recruiter_or_admin, CurrentUser
 from core.phase4_llm.llm_service import llm_service
 
+# Handlers are plain `def` so FastAPI runs them in its threadpool - the sync
+# SQLAlchemy session and LLM calls would otherwise block the event loop
 router = APIRouter(prefix="/api/company", tags=["company"])
 
+# Application status values in declaration order, computed once
+_STATUS_VALUES = tuple(status.value for status in ApplicationStatus)
+
+
+def _encode_cursor(last_id: int) -> str:
+    """Opaque keyset-pagination cursor pointing after the given id"""
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> int:
+    """Decode a cursor from _encode_cursor"""
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def require_company_id(current_user: CurrentUser = Depends(require_recruiter)) -> int:
+    """Recruiter's company id - rejects recruiters without a company"""
+    if not current_user.company_id:
+        raise HTTPException(status_code=400, detail="User not associated with a company")
+    return current_user.company_id
+
+
+def company_scoped_apps(company_id: int = Depends(require_company_id)) -> Select:
+    """
+    Applications select with the tenant filter already attached
+    Endpoints chain their own columns/filters onto it, so the company scope can't be forgotten
+    """
+    return select(Application).join(
+        Internship, Internship.id == Application.internship_id
+    ).where(Internship.company_id == company_id)
+
+# Analytics overview results per (company_id, internship_id), kept briefly so
+# dashboard refreshes don't re-run the aggregates. Per worker process.
+ANALYTICS_CACHE_TTL_SECONDS = 45
+ANALYTICS_CACHE_MAX_SIZE = 1024
+_analytics_cache: Dict[Tuple[int, Optional[int]], Tuple[float, dict]] = {}
+
+# Rankings per (company_id, internship_id, limit) - same idea, slightly longer TTL
+RANKINGS_CACHE_TTL_SECONDS = 60
+RANKINGS_CACHE_MAX_SIZE = 1024
+_rankings_cache: Dict[Tuple[int, Optional[int], int], Tuple[float, dict]] = {}
+
+# Application list totals per (company_id, internship_id, status) - recruiters
+# page through the same filter repeatedly, so the count only runs once per window
+APPLICATION_COUNT_CACHE_MAX_SIZE = 1024
+APPLICATION_COUNT_CACHE_TTL_SECONDS = 30
+_application_count_cache: Dict[Tuple[int, Optional[int], Optional[str]], Tuple[float, int]] = {}
+
+
+# Handlers run in the threadpool: writes and clears of the caches above take this lock
+# so two evictions can't race for the same oldest key (reads are plain dict lookups)
+_cache_lock = threading.Lock()
+
+
+def _cache_store(cache: dict, key, value, max_size: int):
+    """
+    Store (now, value) under key, evicting the oldest entries when full
+    Keys include caller-supplied filters, so the size cap bounds memory per worker
+    """
+    with _cache_lock:
+        cache.pop(key, None)
+        while len(cache) >= max_size:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = (time.monotonic(), value)
+
+
+@event.listens_for(Application, "after_insert")
+@event.listens_for(Application, "after_update")
+@event.listens_for(Application, "after_delete")
+@event.listens_for(Evaluation, "after_insert")
+@event.listens_for(Evaluation, "after_update")
+def _invalidate_analytics_cache(mapper, connection, target):
+    """Drop cached analytics, rankings and counts when applications or scores change"""
+    with _cache_lock:
+        _analytics_cache.clear()
+        _rankings_cache.clear()
+        _application_count_cache.clear()
+
+
+# User columns shown in rankings - other user writes (e.g. last_login) leave the caches alone
+_RANKED_USER_FIELDS = ("name", "email", "github_url")
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_rankings_for_user(mapper, connection, target):
+    """Drop cached rankings when a candidate's displayed details change"""
+    attrs = inspect(target).attrs
+    if any(attrs[field].history.has_changes() for field in _RANKED_USER_FIELDS):
+        with _cache_lock:
+            _rankings_cache.clear()
+
 
 # ============= Internships Management =============
 
 @router.get("/internships")
-async def get_company_internships(
-    current_user: CurrentUser = Depends(require_recruiter),
+def get_company_internships(
+    company_id: int = Depends(require_company_id),
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100)
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None
 ):
-    """Get all internships for recruiter's company"""
-    if not current_user.company_id:
-        raise HTTPException(status_code=400, detail="User not associated with a company")
-    
-    internships = db.query(Internship).filter(
-        Internship.company_id == current_user.company_id
-    ).offset(skip).limit(limit).all()
-    
-    total = db.query(func.count(Internship.id)).filter(
-        Internship.company_id == current_user.company_id
-    ).scalar()
-    
-    return {
+    """
+    Get all internships for recruiter's company
+    Pass the previous response's next_cursor to seek to the next page instead of using skip
+    """
+    keyset = []
+    if cursor:
+        keyset.append(Internship.id > _decode_cursor(cursor))
+        skip = 0
+    
+    # Application counts via LEFT JOIN + GROUP BY; the window count carries the total
+    # Only the listed columns (grouped by the primary key) - no ORM entities to hydrate
+    rows = db.query(
+        Internship.id,
+        Internship.title,
+        Internship.role_type,
+        Internship.location,
+        Internship.duration_months,
+        Internship.aura_enabled,
+        Internship.is_active,
+        Internship.posted_at,
+        Internship.deadline,
+        func.count(Application.id).label("application_count"),
+        func.count().over().label("total")
+    ).outerjoin(
+        Application, Application.internship_id == Internship.id
+    ).filter(
+        Internship.company_id == company_id,
+        *keyset
+    ).group_by(Internship.id).order_by(Internship.id).offset(skip).limit(limit).all()
+    
+    if rows and not cursor:
+        total = rows[0].total
+    elif skip or cursor:
+        # Page past the end, or the window only saw rows after the cursor - count directly
+        total = db.query(func.count(Internship.id)).filter(
+            Internship.company_id == company_id
+        ).scalar()
+    else:
+        total = 0
+    
+    # Returned directly so orjson serializes the rows without a jsonable_encoder pass
+    return ORJSONResponse({
         "items": [{
-            "id": i.id,
-            "title": i.title,
-            "role_type": i.role_type,
-            "location": i.location,
-            "duration_months": i.duration_months,
-            "aura_enabled": i.aura_enabled,
-            "is_active": i.is_active,
-            "posted_at": i.posted_at,
-            "deadline": i.deadline,
-            "application_count": db.query(func.count(Application.id)).filter(
-                Application.internship_id == i.id
-            ).scalar()
-        } for i in internships],
-        "total": total
-    }
+            "id": row.id,
+            "title": row.title,
+            "role_type": row.role_type,
+            "location": row.location,
+            "duration_months": row.duration_months,
+            "aura_enabled": row.aura_enabled,
+            "is_active": row.is_active,
+            "posted_at": row.posted_at,
+            "deadline": row.deadline,
+            "application_count": row.application_count
+        } for row in rows],
+        "total": total,
+        "next_cursor": _encode_cursor(rows[-1].id) if len(rows) == limit else None
+    })
 
 
 @router.get("/internships/{internship_id}")
-async def get_internship_details(
+def get_internship_details(
     internship_id: int,
-    current_user: CurrentUser = Depends(require_recruiter),
+    company_id: int = Depends(require_company_id),
     db: Session = Depends(get_db)
 ):
     """Get detailed internship information"""
-    internship = db.query(Internship).filter(
+    internship = db.query(Internship).options(undefer(Internship.description)).filter(
         Internship.id == internship_id,
-        Internship.company_id == current_user.company_id
+        Internship.company_id == company_id
     ).first()
     
     if not internship:
@@ -92,47 +222,61 @@ async def get_internship_details(
 # ============= Applications Management =============
 
 @router.get("/applications")
-async def get_applications(
-    current_user: CurrentUser = Depends(require_recruiter),
+def get_applications(
+    company_id: int = Depends(require_company_id),
+    scoped_apps: Select = Depends(company_scoped_apps),
     db: Session = Depends(get_db),
     internship_id: Optional[int] = None,
     status: Optional[str] = None,
     skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100)
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None
 ):
-    """Get all applications for company's internships"""
-    if not current_user.company_id:
-        raise HTTPException(status_code=400, detail="User not associated with a company")
-    
-    # Base query - join with internship to filter by company
-    query = db.query(Application).join(Internship).filter(
-        Internship.company_id == current_user.company_id
-    )
-    
-    # Apply filters
+    """
+    Get all applications for company's internships
+    Pass the previous response's next_cursor to seek to the next page instead of using skip
+    """
+    # Filters shared by the page query and the count query (tenant scope is already attached)
+    filters = []
     if internship_id:
-        query = query.filter(Application.internship_id == internship_id)
+        filters.append(Application.internship_id == internship_id)
     if status:
-        query = query.filter(Application.status == status)
-    
-    # Get results
-    applications = query.offset(skip).limit(limit).all()
-    total = query.count()
+        if status not in _STATUS_VALUES:
+            # Unknown status - nothing can match
+            return ORJSONResponse({"items": [], "total": 0, "next_cursor": None})
+        # Bind the enum member so the comparison runs against the native ENUM type
+        filters.append(Application.status == ApplicationStatus(status))
+    
+    # Keyset pagination seeks past the last id instead of scanning OFFSET rows
+    keyset = []
+    if cursor:
+        keyset.append(Application.id > _decode_cursor(cursor))
+        skip = 0
+    
+    # Single query: application + user + AURA score, internship populated from the same JOIN
+    rows = db.execute(scoped_apps.add_columns(User, Evaluation.overall_score).join(
+        User, User.id == Application.user_id
+    ).outerjoin(
+        Evaluation, Evaluation.candidate_id == Application.candidate_id
+    ).options(
+        contains_eager(Application.internship),
+        raiseload("*")
+    ).where(*filters, *keyset).order_by(Application.id).offset(skip).limit(limit)).all()
+    
+    # Count shares only the WHERE predicates - no eager loads, ordering or keyset
+    count_key = (company_id, internship_id, status)
+    cached = _application_count_cache.get(count_key)
+    if cached and time.monotonic() - cached[0] < APPLICATION_COUNT_CACHE_TTL_SECONDS:
+        total = cached[1]
+    else:
+        total = db.scalar(
+            scoped_apps.with_only_columns(func.count(), maintain_column_froms=True).where(*filters)
+        )
+        _cache_store(_application_count_cache, count_key, total, APPLICATION_COUNT_CACHE_MAX_SIZE)
     
     # Format response with user and AURA data
     items = []
-    for app in applications:
-        user = db.query(User).filter(User.id == app.user_id).first()
-        candidate = None
-        aura_score = None
-        
-        if app.candidate_id:
-            candidate = db.query(Candidate).filter(Candidate.id == app.candidate_id).first()
-            if candidate:
-                eval_data = db.query(Evaluation).filter(Evaluation.candidate_id == candidate.id).first()
-                if eval_data:
-                    aura_score = eval_data.overall_score
-        
+    for app, user, aura_score in rows:
         items.append({
             "id": app.id,
             "internship_id": app.internship_id,
@@ -147,25 +291,30 @@ async def get_applications(
             "applied_at": app.applied_at
         })
     
-    return {"items": items, "total": total}
+    # Returned directly so orjson serializes enums/datetimes without a jsonable_encoder pass
+    next_cursor = _encode_cursor(rows[-1][0].id) if len(rows) == limit else None
+    return ORJSONResponse({"items": items, "total": total, "next_cursor": next_cursor})
 
 
 @router.get("/applications/{application_id}")
-async def get_application_detail(
+def get_application_detail(
     application_id: int,
-    current_user: CurrentUser = Depends(require_recruiter),
+    scoped_apps: Select = Depends(company_scoped_apps),
     db: Session = Depends(get_db)
 ):
     """Get detailed application with AURA assessment"""
-    app = db.query(Application).join(Internship).filter(
-        Application.id == application_id,
-        Internship.company_id == current_user.company_id
-    ).first()
+    # Everything the response touches is loaded explicitly; any other lazy load raises
+    app = db.scalars(scoped_apps.options(
+        selectinload(Application.internship),
+        selectinload(Application.user),
+        selectinload(Application.candidate).selectinload(Candidate.evaluation),
+        raiseload("*")
+    ).where(Application.id == application_id)).first()
     
     if not app:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    user = db.query(User).filter(User.id == app.user_id).first()
+    user = app.user
     
     result = {
         "id": app.id,
@@ -187,9 +336,9 @@ async def get_application_detail(
     
     # Add AURA assessment if available
     if app.candidate_id:
-        candidate = db.query(Candidate).filter(Candidate.id == app.candidate_id).first()
+        candidate = app.candidate
         if candidate:
-            evaluation = db.query(Evaluation).filter(Evaluation.candidate_id == candidate.id).first()
+            evaluation = candidate.evaluation
             if evaluation:
                 result["aura_data"] = {
                     "candidate_id": candidate.id,
@@ -210,117 +359,105 @@ async def get_application_detail(
 # ============= Analytics & Rankings =============
 
 @router.get("/analytics/overview")
-async def get_analytics_overview(
-    current_user: CurrentUser = Depends(require_recruiter),
+def get_analytics_overview(
+    company_id: int = Depends(require_company_id),
+    scoped_apps: Select = Depends(company_scoped_apps),
     db: Session = Depends(get_db),
     internship_id: Optional[int] = None
 ):
     """Get analytics overview for company internships"""
-    if not current_user.company_id:
-        raise HTTPException(status_code=400, detail="User not associated with a company")
-    
-    # Base query
-    query = db.query(Application).join(Internship).filter(
-        Internship.company_id == current_user.company_id
-    )
+    cache_key = (company_id, internship_id or None)
+    cached = _analytics_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < ANALYTICS_CACHE_TTL_SECONDS:
+        return cached[1]
     
+    filters = []
     if internship_id:
-        query = query.filter(Application.internship_id == internship_id)
-    
-    # Total applications
-    total_applications = query.count()
-    
-    # Status breakdown
-    status_counts = {}
-    for status in ApplicationStatus:
-        count = query.filter(Application.status == status.value).count()
+        filters.append(Application.internship_id == internship_id)
+    
+    # One GROUP BY status query; totals and the average score are summed from its rows
+    status_rows = db.execute(scoped_apps.with_only_columns(
+        Application.status,
+        func.count(Application.id),
+        func.count(Application.aura_completed_at),
+        func.sum(Evaluation.overall_score),
+        func.count(Evaluation.overall_score),
+        maintain_column_froms=True
+    ).outerjoin(
+        Evaluation, Evaluation.candidate_id == Application.candidate_id
+    ).where(*filters).group_by(Application.status)).all()
+    
+    status_counts = dict.fromkeys(_STATUS_VALUES, 0)
+    total_applications = aura_completed = scored = 0
+    score_sum = 0.0
+    for status, count, completed, status_score_sum, status_scored in status_rows:
         status_counts[status.value] = count
+        total_applications += count
+        aura_completed += completed
+        score_sum += status_score_sum or 0
+        scored += status_scored
+    avg_score = score_sum / scored if scored else 0
     
-    # AURA statistics
-    aura_completed = query.filter(Application.aura_completed_at.isnot(None)).count()
-    
-    # Average AURA score
-    avg_score_query = db.query(func.avg(Evaluation.overall_score)).join(
-        Candidate, Candidate.id == Evaluation.candidate_id
-    ).join(
-        Application, Application.candidate_id == Candidate.id
-    ).join(
-        Internship, Internship.id == Application.internship_id
-    ).filter(
-        Internship.company_id == current_user.company_id
-    )
-    
-    if internship_id:
-        avg_score_query = avg_score_query.filter(Application.internship_id == internship_id)
-    
-    avg_score = avg_score_query.scalar() or 0
-    
-    return {
+    result = {
         "total_applications": total_applications,
         "status_breakdown": status_counts,
         "aura_completed": aura_completed,
         "aura_average_score": round(avg_score, 2)
     }
+    _cache_store(_analytics_cache, cache_key, result, ANALYTICS_CACHE_MAX_SIZE)
+    
+    return result
 
 
 @router.get("/rankings")
-async def get_candidate_rankings(
-    current_user: CurrentUser = Depends(require_recruiter),
+def get_candidate_rankings(
+    company_id: int = Depends(require_company_id),
+    scoped_apps: Select = Depends(company_scoped_apps),
     db: Session = Depends(get_db),
     internship_id: Optional[int] = None,
     limit: int = Query(20, ge=1, le=100)
 ):
     """Get ranked list of candidates by AURA score"""
-    if not current_user.company_id:
-        raise HTTPException(status_code=400, detail="User not associated with a company")
-    
-    # Query applications with evaluations
-    query = db.query(
-        Application,
-        User,
-        Candidate,
-        Evaluation
-    ).join(
-        Internship, Internship.id == Application.internship_id
+    cache_key = (company_id, internship_id or None, limit)
+    cached = _rankings_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < RANKINGS_CACHE_TTL_SECONDS:
+        return ORJSONResponse(cached[1])
+    
+    # Rank computed in SQL; Application.id breaks score ties deterministically.
+    # Only the response columns are selected, labelled with their response keys.
+    ranking_order = (desc(Evaluation.overall_score), Application.id)
+    stmt = scoped_apps.with_only_columns(
+        func.row_number().over(order_by=ranking_order).label("rank"),
+        Application.id.label("application_id"),
+        User.name.label("user_name"),
+        User.email.label("user_email"),
+        User.github_url,
+        Application.internship_id,
+        Internship.title.label("internship_title"),
+        Evaluation.overall_score,
+        Evaluation.understanding_score,
+        Evaluation.reasoning_score,
+        Evaluation.communication_score,
+        Evaluation.logic_score,
+        Evaluation.hire_recommendation,
+        Application.aura_completed_at.label("completed_at"),
+        maintain_column_froms=True
     ).join(
         User, User.id == Application.user_id
     ).join(
-        Candidate, Candidate.id == Application.candidate_id
-    ).join(
-        Evaluation, Evaluation.candidate_id == Candidate.id
-    ).filter(
-        Internship.company_id == current_user.company_id,
-        Application.aura_completed_at.isnot(None)
-    )
+        Evaluation, Evaluation.candidate_id == Application.candidate_id
+    ).where(Application.aura_completed_at.isnot(None))
     
     if internship_id:
-        query = query.filter(Application.internship_id == internship_id)
+        stmt = stmt.where(Application.internship_id == internship_id)
     
     # Order by score descending
-    query = query.order_by(desc(Evaluation.overall_score))
-    
-    results = query.limit(limit).all()
-    
-    rankings = []
-    for rank, (app, user, candidate, evaluation) in enumerate(results, 1):
-        rankings.append({
-            "rank": rank,
-            "application_id": app.id,
-            "user_name": user.name,
-            "user_email": user.email,
-            "github_url": user.github_url,
-            "internship_id": app.internship_id,
-            "internship_title": app.internship.title,
-            "overall_score": evaluation.overall_score,
-            "understanding_score": evaluation.understanding_score,
-            "reasoning_score": evaluation.reasoning_score,
-            "communication_score": evaluation.communication_score,
-            "logic_score": evaluation.logic_score,
-            "hire_recommendation": evaluation.hire_recommendation,
-            "completed_at": app.aura_completed_at
-        })
+    rankings = [dict(row) for row in db.execute(stmt.order_by(*ranking_order).limit(limit)).mappings()]
     
-    return {"rankings": rankings, "total": len(rankings)}
+    result = {"rankings": rankings, "total": len(rankings)}
+    _cache_store(_rankings_cache, cache_key, result, RANKINGS_CACHE_MAX_SIZE)
+    
+    return ORJSONResponse(result)
 
 
 # ============= Job Description & Question Management =============
@@ -346,8 +483,58 @@ class JobDescriptionResponse(BaseModel):
     is_active: bool
 
 
+# InterviewQuestion fields stored in JobDescription.questions_data
+_QUESTION_DATA_FIELDS = frozenset({
+    "question_text", "question_type", "difficulty", "context", "expected_keywords", "evaluation_criteria"
+})
+
+
+def _questions_to_data(questions) -> List[dict]:
+    """Serialize generated questions for JobDescription.questions_data"""
+    return [q.model_dump(include=_QUESTION_DATA_FIELDS) for q in questions]
+
+
+# Generated JD questions by content hash - identical JD submissions skip the LLM.
+# Per worker process; the key is derived from the content, so no invalidation.
+JD_QUESTIONS_CACHE_TTL_SECONDS = 24 * 60 * 60
+JD_QUESTIONS_CACHE_MAX_SIZE = 256
+_jd_questions_cache: Dict[str, Tuple[float, List[dict]]] = {}
+
+
+def _generate_jd_questions(
+    description_text: str,
+    role_type: str,
+    required_skills: List[str],
+    preferred_skills: Optional[List[str]]
+) -> List[dict]:
+    """Generate questions_data for a JD, reusing cached output for identical input"""
+    key = hashlib.sha256(orjson.dumps(
+        [description_text, role_type, sorted(required_skills), sorted(preferred_skills or [])]
+    )).hexdigest()
+    now = time.monotonic()
+    
+    cached = _jd_questions_cache.get(key)
+    if cached and now - cached[0] < JD_QUESTIONS_CACHE_TTL_SECONDS:
+        logger.info("Reusing cached questions for identical job description")
+        return [dict(q) for q in cached[1]]
+    
+    questions, used_fallback = llm_service.generate_jd_questions_with_fallback_flag(
+        job_description=description_text,
+        role_type=role_type,
+        required_skills=required_skills,
+        preferred_skills=preferred_skills
+    )
+    questions_data = _questions_to_data(questions)
+    
+    # The LLM service swallows failures and pads with template questions - don't pin those
+    if not used_fallback:
+        _cache_store(_jd_questions_cache, key, questions_data, JD_QUESTIONS_CACHE_MAX_SIZE)
+    
+    return [dict(q) for q in questions_data]
+
+
 @router.post("/job-descriptions")
-async def create_job_description(
+def create_job_description(
     jd_data: JobDescriptionCreate,
     current_user: CurrentUser = Depends(require_recruiter_or_admin),
     db: Session = Depends(get_db)
@@ -375,34 +562,25 @@ async def create_job_description(
     if existing_jd:
         raise HTTPException(status_code=400, detail="Job description already exists for this internship")
     
+    role_type = internship.role_type
+    # End the read transaction so no pooled connection is held during the LLM call
+    db.rollback()
+    
     try:
         # Generate questions using LLM
         logger.info(f"Generating questions for JD of internship {jd_data.internship_id}")
-        questions = llm_service.generate_questions_from_job_description(
-            job_description=jd_data.description_text,
-            role_type=internship.role_type,
-            required_skills=jd_data.required_skills,
-            preferred_skills=jd_data.preferred_skills
+        questions_data = _generate_jd_questions(
+            jd_data.description_text,
+            role_type,
+            jd_data.required_skills,
+            jd_data.preferred_skills
         )
         
-        # Convert questions to JSON format
-        questions_data = [
-            {
-                "question_text": q.question_text,
-                "question_type": q.question_type,
-                "difficulty": q.difficulty,
-                "context": q.context,
-                "expected_keywords": q.expected_keywords,
-                "evaluation_criteria": q.evaluation_criteria
-            }
-            for q in questions
-        ]
-        
         # Create job description
         job_description = JobDescription(
             internship_id=jd_data.internship_id,
             description_text=jd_data.description_text,
-            role_type=internship.role_type,
+            role_type=role_type,
             required_skills=jd_data.required_skills,
             preferred_skills=jd_data.preferred_skills or [],
             questions_data=questions_data,
@@ -440,28 +618,30 @@ async def create_job_description(
 
 
 @router.get("/job-descriptions/{internship_id}")
-async def get_job_description(
+def get_job_description(
     internship_id: int,
     current_user: CurrentUser = Depends(require_recruiter_or_admin),
     db: Session = Depends(get_db)
 ):
     """Get job description for an internship"""
-    # Verify internship belongs to company (unless admin)
-    internship = db.query(Internship).filter(Internship.id == internship_id).first()
-    if not internship:
+    # Internship ownership and its JD in one query
+    row = db.query(Internship.company_id, JobDescription).outerjoin(
+        JobDescription, JobDescription.internship_id == Internship.id
+    ).filter(Internship.id == internship_id).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Internship not found")
     
-    if current_user.role != "admin" and internship.company_id != current_user.company_id:
-        raise HTTPException(status_code=403, detail="Cannot access another company's job description")
+    company_id, job_description = row
     
-    job_description = db.query(JobDescription).filter(
-        JobDescription.internship_id == internship_id
-    ).first()
+    # Verify internship belongs to company (unless admin)
+    if current_user.role != "admin" and company_id != current_user.company_id:
+        raise HTTPException(status_code=403, detail="Cannot access another company's job description")
     
     if not job_description:
         raise HTTPException(status_code=404, detail="Job description not found")
     
-    return {
+    # questions_data can be large - let orjson serialize it directly
+    return ORJSONResponse({
         "id": job_description.id,
         "internship_id": job_description.internship_id,
         "description_text": job_description.description_text,
@@ -473,11 +653,11 @@ async def get_job_description(
         "created_at": job_description.created_at,
         "updated_at": job_description.updated_at,
         "is_active": job_description.is_active
-    }
+    })
 
 
 @router.put("/job-descriptions/{internship_id}")
-async def update_job_description(
+def update_job_description(
     internship_id: int,
     jd_data: JobDescriptionCreate,
     current_user: CurrentUser = Depends(require_recruiter_or_admin),
@@ -502,35 +682,27 @@ async def update_job_description(
     if not job_description:
         raise HTTPException(status_code=404, detail="Job description not found")
     
+    jd_id = job_description.id
+    role_type = internship.role_type
+    # End the read transaction so no pooled connection is held during the LLM call
+    db.rollback()
+    
     try:
         # Regenerate questions
-        logger.info(f"Regenerating questions for JD {job_description.id}")
-        questions = llm_service.generate_questions_from_job_description(
-            job_description=jd_data.description_text,
-            role_type=internship.role_type,
-            required_skills=jd_data.required_skills,
-            preferred_skills=jd_data.preferred_skills
+        logger.info(f"Regenerating questions for JD {jd_id}")
+        questions_data = _generate_jd_questions(
+            jd_data.description_text,
+            role_type,
+            jd_data.required_skills,
+            jd_data.preferred_skills
         )
         
-        # Convert questions to JSON format
-        questions_data = [
-            {
-                "question_text": q.question_text,
-                "question_type": q.question_type,
-                "difficulty": q.difficulty,
-                "context": q.context,
-                "expected_keywords": q.expected_keywords,
-                "evaluation_criteria": q.evaluation_criteria
-            }
-            for q in questions
-        ]
-        
         # Update job description
         job_description.description_text = jd_data.description_text
         job_description.required_skills = jd_data.required_skills
         job_description.preferred_skills = jd_data.preferred_skills or []
         job_description.questions_data = questions_data
-        job_description.updated_at = datetime.utcnow()
+        job_description.updated_at = func.now()
         
         db.commit()
         db.refresh(job_description)
@@ -558,7 +730,7 @@ async def update_job_description(
 
 
 @router.delete("/job-descriptions/{internship_id}")
-async def delete_job_description(
+def delete_job_description(
     internship_id: int,
     current_user: CurrentUser = Depends(require_recruiter_or_admin),
     db: Session = Depends(get_db)
@@ -567,25 +739,27 @@ async def delete_job_description(
     Delete/deactivate job description
     Only accessible by company recruiters and admins
     """
-    # Verify internship belongs to company (unless admin)
-    internship = db.query(Internship).filter(Internship.id == internship_id).first()
+    # Verify internship belongs to company (unless admin) - only the owning company is needed
+    internship = db.query(Internship.company_id).filter(Internship.id == internship_id).first()
     if not internship:
         raise HTTPException(status_code=404, detail="Internship not found")
     
     if current_user.role != "admin" and internship.company_id != current_user.company_id:
         raise HTTPException(status_code=403, detail="Cannot delete another company's job description")
     
-    job_description = db.query(JobDescription).filter(
-        JobDescription.internship_id == internship_id
+    # Deactivate instead of delete - UPDATE ... RETURNING, no row hydration
+    deactivated = db.execute(
+        update(JobDescription).where(
+            JobDescription.internship_id == internship_id
+        ).values(is_active=False).returning(JobDescription.id)
     ).first()
     
-    if not job_description:
+    if not deactivated:
         raise HTTPException(status_code=404, detail="Job description not found")
     
-    # Deactivate instead of delete
-    job_description.is_active = False
-    internship.use_jd_questions = False
-    
+    db.execute(
+        update(Internship).where(Internship.id == internship_id).values(use_jd_questions=False)
+    )
     db.commit()
     
     return {"message": "Job description deactivated successfully"}
@@ -2,91 +2,218 @@
 Student portal API routes
 """
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, joinedload, selectinload, lazyload
+from sqlalchemy import select, func, event, inspect
+from typing import Any, Dict, List, Optional, Tuple
+import time
+import threading
 from pydantic import BaseModel
 
 from models import get_db
 from models.database import Candidate, Evaluation, Question, QuestionScore, JobDescription
-from models.multi_tenant import Internship, Application, ApplicationStatus, User
+from models.multi_tenant import Company, Internship, Application, ApplicationStatus, User
 from core.auth import require_student, CurrentUser
 from loguru import logger
 
+# Handlers are plain `def` so FastAPI runs them in its threadpool - the sync
+# SQLAlchemy session would otherwise block the event loop for every query.
+# Read endpoints return ORJSONResponse directly so orjson serializes enums and
+# datetimes natively, skipping the jsonable_encoder pass
 router = APIRouter(prefix="/api/student", tags=["student"])
 
+# Read-only responses per student: user_id -> {(endpoint,): (stored_at, response)}.
+# Always scoped by the authenticated user's id, and keyed by fixed endpoint names only -
+# never request params - so a user's entries stay bounded. Per worker process; the
+# mapper events below drop a student's entries when their data changes, but only on
+# the worker that made the write, so pages that must reflect the student's own
+# writes (the applications list) are not cached.
+STUDENT_CACHE_TTL_SECONDS = 60
+STUDENT_CACHE_MAX_USERS = 10000
+_student_cache: Dict[int, Dict[Tuple, Tuple[float, Any]]] = {}
+# Threadpool handlers and flush events add/evict/drop students concurrently
+_student_cache_lock = threading.Lock()
+
+
+def _get_cached(user_id: int, key: Tuple):
+    """Cached response for this student, or None if missing/expired"""
+    cached = _student_cache.get(user_id, {}).get(key)
+    if cached and time.monotonic() - cached[0] < STUDENT_CACHE_TTL_SECONDS:
+        return cached[1]
+    return None
+
+
+def _set_cached(user_id: int, key: Tuple, response):
+    """Store a response for this student, evicting the oldest student when full"""
+    with _student_cache_lock:
+        entries = _student_cache.get(user_id)
+        if entries is None:
+            if len(_student_cache) >= STUDENT_CACHE_MAX_USERS:
+                _student_cache.pop(next(iter(_student_cache)), None)
+            entries = _student_cache[user_id] = {}
+        entries[key] = (time.monotonic(), response)
+
+
+@event.listens_for(Application, "after_insert")
+@event.listens_for(Application, "after_update")
+@event.listens_for(Application, "after_delete")
+def _invalidate_student_applications(mapper, connection, target):
+    """Drop the owning student's cached responses when an application changes"""
+    with _student_cache_lock:
+        _student_cache.pop(target.user_id, None)
+
+
+# User columns the cached responses show - last_login refreshes from auth don't count
+_PROFILE_USER_FIELDS = ("email", "name", "github_url", "resume_url")
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_student_profile(mapper, connection, target):
+    """Drop a student's cached responses when their profile details change"""
+    attrs = inspect(target).attrs
+    if any(attrs[field].history.has_changes() for field in _PROFILE_USER_FIELDS):
+        with _student_cache_lock:
+            _student_cache.pop(target.id, None)
+
+
+@event.listens_for(Evaluation, "after_insert")
+@event.listens_for(Evaluation, "after_update")
+def _invalidate_student_scores(mapper, connection, target):
+    """Evaluations aren't keyed by user - drop everything (rare: once per completed assessment)"""
+    with _student_cache_lock:
+        _student_cache.clear()
+
+
+def own_application(*options):
+    """
+    Dependency factory: the current student's application from the path, or 404
+    Each endpoint passes the loader options for just the relationships it reads
+    """
+    def dependency(
+        application_id: int,
+        current_user: CurrentUser = Depends(require_student),
+        db: Session = Depends(get_db)
+    ) -> Application:
+        app = db.query(Application).options(*options).filter(
+            Application.id == application_id,
+            Application.user_id == current_user.id
+        ).first()
+        
+        if not app:
+            raise HTTPException(status_code=404, detail="Application not found")
+        
+        return app
+    
+    return dependency
+
 
 # ============= My Applications =============
 
+def _aura_summary(row) -> Optional[dict]:
+    """AURA state for an applications-list row (no DB access)"""
+    if not row.candidate_id or row.candidate_row_id is None:
+        return None
+    if row.evaluation_id is None:
+        return {"completed": False, "in_progress": True}
+    return {
+        "completed": True,
+        "score": row.overall_score,
+        "completed_at": row.aura_completed_at
+    }
+
+
 @router.get("/applications")
-async def get_my_applications(
+def get_my_applications(
     current_user: CurrentUser = Depends(require_student),
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100)
 ):
-    """Get all applications for current student"""
-    applications = db.query(Application).filter(
+    """
+    Get all applications for current student
+    Not cached: the cache is per worker, and after starting an assessment the
+    student must see the new status on whichever worker serves the next request
+    """
+    # Plain column rows (no ORM hydration): internship/company JOINed in, AURA state
+    # from outer joins, and the window count carrying the total on every row
+    rows = db.execute(select(
+        Application.id,
+        Application.status,
+        Application.applied_at,
+        Application.candidate_id,
+        Application.aura_completed_at,
+        Internship.id.label("internship_id"),
+        Internship.title,
+        Company.name.label("company_name"),
+        Internship.role_type,
+        Internship.location,
+        Internship.aura_enabled,
+        Internship.aura_required,
+        Candidate.id.label("candidate_row_id"),
+        Evaluation.id.label("evaluation_id"),
+        Evaluation.overall_score,
+        func.count().over().label("total")
+    ).join(
+        Internship, Internship.id == Application.internship_id
+    ).outerjoin(
+        Company, Company.id == Internship.company_id
+    ).outerjoin(
+        Candidate, Candidate.id == Application.candidate_id
+    ).outerjoin(
+        Evaluation, Evaluation.candidate_id == Candidate.id
+    ).where(
         Application.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
+    ).order_by(Application.id).offset(skip).limit(limit)).all()
     
-    total = db.query(Application).filter(
-        Application.user_id == current_user.id
-    ).count()
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end - the window saw no rows, count directly
+        total = db.query(func.count(Application.id)).filter(
+            Application.user_id == current_user.id
+        ).scalar()
+    else:
+        total = 0
     
-    items = []
-    for app in applications:
-        internship = db.query(Internship).filter(Internship.id == app.internship_id).first()
-        
-        aura_data = None
-        if app.candidate_id:
-            candidate = db.query(Candidate).filter(Candidate.id == app.candidate_id).first()
-            if candidate:
-                evaluation = db.query(Evaluation).filter(Evaluation.candidate_id == candidate.id).first()
-                if evaluation:
-                    aura_data = {
-                        "completed": True,
-                        "score": evaluation.overall_score,
-                        "completed_at": app.aura_completed_at
-                    }
-                else:
-                    aura_data = {"completed": False, "in_progress": True}
-        
-        items.append({
-            "id": app.id,
-            "internship": {
-                "id": internship.id,
-                "title": internship.title,
-                "company_name": internship.company.name if internship.company else "Unknown",
-                "role_type": internship.role_type,
-                "location": internship.location,
-                "aura_enabled": internship.aura_enabled,
-                "aura_required": internship.aura_required
-            },
-            "status": app.status,
-            "applied_at": app.applied_at,
-            "aura": aura_data
-        })
+    items = [{
+        "id": row.id,
+        "internship": {
+            "id": row.internship_id,
+            "title": row.title,
+            "company_name": row.company_name if row.company_name is not None else "Unknown",
+            "role_type": row.role_type,
+            "location": row.location,
+            "aura_enabled": row.aura_enabled,
+            "aura_required": row.aura_required
+        },
+        "status": row.status,
+        "applied_at": row.applied_at,
+        "aura": _aura_summary(row)
+    } for row in rows]
     
-    return {"items": items, "total": total}
+    # Paging hints come from the window total - no extra query
+    has_more = skip + len(rows) < total
+    result = {
+        "items": items,
+        "total": total,
+        "has_more": has_more,
+        "next_skip": skip + len(rows) if has_more else None
+    }
+    
+    return ORJSONResponse(result)
 
 
 @router.get("/applications/{application_id}")
-async def get_application_details(
-    application_id: int,
-    current_user: CurrentUser = Depends(require_student),
-    db: Session = Depends(get_db)
+def get_application_details(
+    # Internship (with its deferred description) and company name come back in the same SELECT
+    app: Application = Depends(own_application(
+        joinedload(Application.internship).undefer(Internship.description),
+        joinedload(Application.internship).joinedload(Internship.company).load_only(Company.name),
+        lazyload(Application.candidate)
+    ))
 ):
     """Get detailed application information"""
-    app = db.query(Application).filter(
-        Application.id == application_id,
-        Application.user_id == current_user.id
-    ).first()
-    
-    if not app:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
-    internship = db.query(Internship).filter(Internship.id == app.internship_id).first()
+    internship = app.internship
     
     result = {
         "id": app.id,
@@ -115,28 +242,34 @@ async def get_application_details(
 # ============= AURA Assessment =============
 
 @router.get("/aura/available")
-async def get_available_aura_tests(
+def get_available_aura_tests(
     current_user: CurrentUser = Depends(require_student),
     db: Session = Depends(get_db)
 ):
     """Get applications where AURA test is available but not started"""
-    applications = db.query(Application).filter(
+    rows = db.execute(select(
+        Application.id,
+        Internship.title,
+        Company.name.label("company_name"),
+        Application.aura_invited_at
+    ).join(
+        Internship, Internship.id == Application.internship_id
+    ).outerjoin(
+        Company, Company.id == Internship.company_id
+    ).where(
         Application.user_id == current_user.id,
         Application.status == ApplicationStatus.AURA_INVITED,
         Application.candidate_id.is_(None)
-    ).all()
+    )).all()
     
-    items = []
-    for app in applications:
-        internship = db.query(Internship).filter(Internship.id == app.internship_id).first()
-        items.append({
-            "application_id": app.id,
-            "internship_title": internship.title,
-            "company_name": internship.company.name if internship.company else "Unknown",
-            "invited_at": app.aura_invited_at
-        })
+    items = [{
+        "application_id": row.id,
+        "internship_title": row.title,
+        "company_name": row.company_name if row.company_name is not None else "Unknown",
+        "invited_at": row.aura_invited_at
+    } for row in rows]
     
-    return {"items": items, "total": len(items)}
+    return ORJSONResponse({"items": items, "total": len(items)})
 
 
 class StartAuraRequest(BaseModel):
@@ -145,30 +278,28 @@ class StartAuraRequest(BaseModel):
 
 
 @router.post("/aura/{application_id}/start")
-async def start_aura_assessment(
+def start_aura_assessment(
     application_id: int,
     request: StartAuraRequest,
     background_tasks: BackgroundTasks,
     current_user: CurrentUser = Depends(require_student),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    app: Application = Depends(own_application(
+        joinedload(Application.internship).load_only(
+            Internship.id, Internship.role_type, Internship.use_jd_questions
+        ),
+        lazyload(Application.candidate)
+    ))
 ):
     """
     Start AURA assessment for an application
     Uses JD questions if available, otherwise requires GitHub URL
     """
-    app = db.query(Application).filter(
-        Application.id == application_id,
-        Application.user_id == current_user.id
-    ).first()
-    
-    if not app:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
     if app.status not in [ApplicationStatus.PENDING, ApplicationStatus.AURA_INVITED]:
         raise HTTPException(status_code=400, detail="Application not eligible for AURA assessment")
     
-    # Get internship and check if it uses JD questions
-    internship = db.query(Internship).filter(Internship.id == app.internship_id).first()
+    # Get internship (joined with the application) and check if it uses JD questions
+    internship = app.internship
     if not internship:
         raise HTTPException(status_code=404, detail="Internship not found")
     
@@ -185,14 +316,12 @@ async def start_aura_assessment(
             role_type=internship.role_type
         )
         db.add(candidate)
-        db.commit()
-        db.refresh(candidate)
+        db.flush()  # assigns candidate.id - everything below commits (or rolls back) together
         
         # Link application to candidate
         app.candidate_id = candidate.id
         app.status = ApplicationStatus.AURA_IN_PROGRESS
-        app.aura_started_at = datetime.utcnow()
-        db.commit()
+        app.aura_started_at = func.now()  # stamped by the database inside this transaction
         
         # Generate questions based on internship settings
         if internship.use_jd_questions:
@@ -207,20 +336,23 @@ async def start_aura_assessment(
             
             logger.info(f"Using JD questions for application {application_id}")
             
-            # Create questions from JD
-            for q_data in job_description.questions_data:
-                question = Question(
-                    candidate_id=candidate.id,
-                    job_description_id=job_description.id,
-                    question_text=q_data['question_text'],
-                    question_type=q_data['question_type'],
-                    difficulty=q_data['difficulty'],
-                    context=q_data['context'],
-                    expected_keywords=q_data['expected_keywords'],
-                    source='jd'
-                )
-                db.add(question)
+            # Create questions from JD - Core table INSERT skips the ORM bulk layer; on
+            # psycopg2, executemany is batched into multi-row VALUES (insertmanyvalues)
+            db.execute(Question.__table__.insert(), [
+                {
+                    "candidate_id": candidate.id,
+                    "job_description_id": job_description.id,
+                    "question_text": q_data['question_text'],
+                    "question_type": q_data['question_type'],
+                    "difficulty": q_data['difficulty'],
+                    "context": q_data['context'],
+                    "expected_keywords": q_data['expected_keywords'],
+                    "source": 'jd'
+                }
+                for q_data in job_description.questions_data
+            ])
             
+            candidate.status = "questions_ready"
             db.commit()
             
             return {
@@ -239,6 +371,9 @@ async def start_aura_assessment(
             
             logger.info(f"Starting GitHub-based assessment for application {application_id}")
             
+            # Commit before queuing - the background task reads the candidate in its own session
+            db.commit()
+            
             # Process repository in background
             from main import process_repository
             background_tasks.add_task(process_repository, candidate.id, github_url, internship.role_type)
@@ -257,29 +392,32 @@ async def start_aura_assessment(
 
 
 @router.get("/aura/{application_id}/questions")
-async def get_aura_questions(
-    application_id: int,
-    current_user: CurrentUser = Depends(require_student),
-    db: Session = Depends(get_db)
+def get_aura_questions(
+    db: Session = Depends(get_db),
+    # Only candidate_id is read - skip the default internship/candidate loads
+    app: Application = Depends(own_application(
+        lazyload(Application.internship),
+        lazyload(Application.candidate)
+    ))
 ):
     """Get questions for AURA assessment"""
-    app = db.query(Application).filter(
-        Application.id == application_id,
-        Application.user_id == current_user.id
-    ).first()
-    
-    if not app:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
     if not app.candidate_id:
         raise HTTPException(status_code=400, detail="AURA assessment not started")
     
-    questions = db.query(Question).filter(Question.candidate_id == app.candidate_id).all()
+    # Only the served columns - Question rows also carry answers and metadata
+    questions = db.execute(select(
+        Question.id,
+        Question.question_text,
+        Question.question_type,
+        Question.difficulty,
+        Question.context,
+        Question.source
+    ).where(Question.candidate_id == app.candidate_id)).all()
     
     if not questions:
         raise HTTPException(status_code=404, detail="Questions not yet generated")
     
-    return {
+    return ORJSONResponse({
         "questions": [
             {
                 "question_id": q.id,
@@ -292,40 +430,37 @@ async def get_aura_questions(
             for q in questions
         ],
         "total": len(questions)
-    }
+    })
 
 
 @router.get("/aura/{application_id}/report")
-async def get_my_aura_report(
-    application_id: int,
-    current_user: CurrentUser = Depends(require_student),
-    db: Session = Depends(get_db)
+def get_my_aura_report(
+    db: Session = Depends(get_db),
+    # Candidate (and its evaluation) selectin-loaded with the application; no internship or repository
+    app: Application = Depends(own_application(
+        lazyload(Application.internship),
+        selectinload(Application.candidate).lazyload(Candidate.repository)
+    ))
 ):
     """Get AURA assessment report for student's application"""
-    app = db.query(Application).filter(
-        Application.id == application_id,
-        Application.user_id == current_user.id
-    ).first()
-    
-    if not app:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
     if not app.candidate_id:
         raise HTTPException(status_code=400, detail="AURA assessment not started")
     
-    candidate = db.query(Candidate).filter(Candidate.id == app.candidate_id).first()
+    candidate = app.candidate
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate data not found")
     
-    evaluation = db.query(Evaluation).filter(Evaluation.candidate_id == candidate.id).first()
+    evaluation = candidate.evaluation
     if not evaluation:
         raise HTTPException(status_code=400, detail="Assessment not completed")
     
-    # Get question scores
-    questions = db.query(Question).filter(Question.candidate_id == candidate.id).all()
+    # Get question scores - all scores in one IN query instead of one query per question
+    questions = db.query(Question).options(
+        selectinload(Question.score)
+    ).filter(Question.candidate_id == candidate.id).all()
     question_scores = []
     for q in questions:
-        score = db.query(QuestionScore).filter(QuestionScore.question_id == q.id).first()
+        score = q.score
         if score:
             question_scores.append({
                 "question_type": q.question_type,
@@ -339,7 +474,7 @@ async def get_my_aura_report(
                 "feedback": score.feedback
             })
     
-    return {
+    return ORJSONResponse({
         "candidate_id": candidate.id,
         "overall_score": evaluation.overall_score,
         "dimensional_scores": {
@@ -354,30 +489,33 @@ async def get_my_aura_report(
         "hire_recommendation": evaluation.hire_recommendation,
         "question_scores": question_scores,
         "completed_at": app.aura_completed_at
-    }
+    })
 
 
 # ============= Profile =============
 
 @router.get("/profile")
-async def get_my_profile(
+def get_my_profile(
     current_user: CurrentUser = Depends(require_student),
     db: Session = Depends(get_db)
 ):
     """Get student profile"""
+    cached = _get_cached(current_user.id, ("profile",))
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
     user = db.query(User).filter(User.id == current_user.id).first()
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # Count applications
-    total_applications = db.query(Application).filter(Application.user_id == current_user.id).count()
-    aura_completed = db.query(Application).filter(
-        Application.user_id == current_user.id,
-        Application.aura_completed_at.isnot(None)
-    ).count()
+    # Count applications (COUNT(column) skips NULLs, so both totals come from one scan)
+    total_applications, aura_completed = db.query(
+        func.count(Application.id),
+        func.count(Application.aura_completed_at)
+    ).filter(Application.user_id == current_user.id).one()
     
-    return {
+    result = {
         "id": user.id,
         "email": user.email,
         "name": user.name,
@@ -388,3 +526,6 @@ async def get_my_profile(
             "aura_completed": aura_completed
         }
     }
+    _set_cached(current_user.id, ("profile",), result)
+    
+    return ORJSONResponse(result)
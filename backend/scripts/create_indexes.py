@@ -0,0 +1,86 @@
+"""
+Database Migration Script - Create Missing Indexes
+create_all() only builds indexes for tables it creates, so indexes added to
+existing models never reach an existing database. This creates every index
+declared on the models that is not present yet. Safe to run repeatedly.
+On PostgreSQL indexes are built CONCURRENTLY so tables stay writable, and
+tables that got new indexes are ANALYZEd so the planner starts using them right away.
+Run the migrate_add_* scripts first: indexes on columns they add
+(e.g. candidates.status) are skipped until the column exists.
+"""
+from sqlalchemy import inspect, text
+from loguru import logger
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import engine, Base
+
+def run_migration():
+    """Create indexes declared on the models that are missing from the database"""
+    
+    created = []
+    skipped = []
+    
+    try:
+        # CREATE INDEX CONCURRENTLY can't run inside a transaction - autocommit each statement
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            logger.info("Checking model indexes...")
+            concurrently = conn.dialect.name == "postgresql"
+            inspector = inspect(conn)
+            existing_tables = set(inspector.get_table_names())
+            
+            for table in Base.metadata.sorted_tables:
+                if table.name not in existing_tables:
+                    logger.warning(f"Table {table.name} does not exist yet, skipping (run init_db first)")
+                    continue
+                
+                existing = {index["name"] for index in inspector.get_indexes(table.name)}
+                columns = {column["name"] for column in inspector.get_columns(table.name)}
+                for index in sorted(table.indexes, key=lambda i: i.name):
+                    if index.name in existing:
+                        continue
+                    missing = [column.name for column in index.columns if column.name not in columns]
+                    if missing:
+                        skipped.append(index.name)
+                        logger.warning(
+                            f"Skipping {index.name}: {table.name} has no column {', '.join(missing)} "
+                            f"(run the matching migrate_add_* script first)"
+                        )
+                        continue
+                    if concurrently:
+                        index.dialect_options["postgresql"]["concurrently"] = True
+                    index.create(conn)
+                    created.append(index.name)
+                    logger.success(f"Created index {index.name} on {table.name}")
+                
+                if any(index.name in created for index in table.indexes):
+                    # Refresh planner statistics for the new indexes
+                    conn.execute(text(f"ANALYZE {table.name}"))
+            
+            logger.success("✅ Index migration completed successfully!")
+            
+            # Print summary
+            print("\n" + "="*60)
+            print("INDEX MIGRATION SUMMARY")
+            print("="*60)
+            if created:
+                for name in created:
+                    print(f"✅ Created {name}")
+            elif not skipped:
+                print("✅ All indexes already exist")
+            for name in skipped:
+                print(f"⚠️  Skipped {name} (missing column)")
+            print("="*60 + "\n")
+            
+    except Exception as e:
+        logger.error(f"Index migration failed: {e}")
+        raise
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run_migration()
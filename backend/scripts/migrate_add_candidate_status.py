@@ -0,0 +1,72 @@
+"""
+Database Migration Script - Add Candidate Status Column
+Adds the denormalized candidates.status column and backfills it from
+existing questions/evaluations
+Run this after updating models
+"""
+from sqlalchemy import create_engine, inspect, text
+from loguru import logger
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+
+def run_migration():
+    """Run database migration to add candidate status"""
+    
+    engine = create_engine(settings.DATABASE_URL)
+    
+    try:
+        with engine.begin() as conn:
+            logger.info("Starting database migration...")
+            
+            # 1. Add status column to candidates table
+            columns = [column["name"] for column in inspect(conn).get_columns("candidates")]
+            
+            if 'status' not in columns:
+                conn.execute(text("""
+                    ALTER TABLE candidates
+                    ADD COLUMN status VARCHAR(20) NOT NULL DEFAULT 'processing'
+                """))
+                logger.success("Added status to candidates")
+            else:
+                logger.info("status already exists in candidates")
+            
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_candidates_status
+                ON candidates(status)
+            """))
+            
+            # 2. Backfill status from related data
+            logger.info("Backfilling candidate status...")
+            conn.execute(text("""
+                UPDATE candidates SET status = 'questions_ready'
+                WHERE EXISTS (SELECT 1 FROM questions WHERE questions.candidate_id = candidates.id)
+            """))
+            conn.execute(text("""
+                UPDATE candidates SET status = 'completed'
+                WHERE EXISTS (SELECT 1 FROM evaluations WHERE evaluations.candidate_id = candidates.id)
+            """))
+            
+            logger.success("✅ Migration completed successfully!")
+            
+            # Print summary
+            print("\n" + "="*60)
+            print("MIGRATION SUMMARY")
+            print("="*60)
+            print("✅ Added status column to candidates table")
+            print("✅ Backfilled status from questions and evaluations")
+            print("="*60 + "\n")
+    
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        raise
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run_migration()
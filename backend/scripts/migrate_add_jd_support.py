@@ -3,7 +3,7 @@ Database Migration Script - Add Job Description Support
 Adds JobDescription table and updates Question, Internship tables
 Run this after updating models
 """
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event
 from loguru import logger
 import sys
 import os
@@ -13,101 +13,121 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import settings
 
+# (table, column, column definition) added by this migration
+NEW_COLUMNS = [
+    ("questions", "job_description_id", "INTEGER"),
+    ("questions", "source", "VARCHAR(20) DEFAULT 'github'"),
+    ("internships", "use_jd_questions", "BOOLEAN DEFAULT 0"),
+]
+
+
+CREATE_JOB_DESCRIPTIONS = """
+CREATE TABLE IF NOT EXISTS job_descriptions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    internship_id INTEGER NOT NULL UNIQUE,
+    description_text TEXT NOT NULL,
+    role_type VARCHAR(50) NOT NULL,
+    required_skills JSON,
+    preferred_skills JSON,
+    questions_data JSON NOT NULL,
+    created_by INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_active BOOLEAN DEFAULT 1,
+    FOREIGN KEY (internship_id) REFERENCES internships(id),
+    FOREIGN KEY (created_by) REFERENCES users(id)
+);
+"""
+
+# Planner stats for the new columns/index. PRAGMA optimize skips tables this
+# connection hasn't queried, so ANALYZE them directly (bounded by analysis_limit)
+FINALIZE = """
+CREATE INDEX IF NOT EXISTS idx_questions_job_description ON questions(job_description_id);
+PRAGMA analysis_limit=400;
+ANALYZE job_descriptions;
+ANALYZE questions;
+ANALYZE internships;
+"""
+
+
 def run_migration():
     """Run database migration to add JD support"""
     
     engine = create_engine(settings.DATABASE_URL)
     
+    if engine.dialect.name == "sqlite":
+        # The migration script carries its own BEGIN/COMMIT - keep pysqlite from
+        # managing transactions around it
+        @event.listens_for(engine, "connect")
+        def _configure_sqlite(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+            # Set before BEGIN - journal_mode cannot change inside a transaction.
+            # temp_store=MEMORY is fine here: the script runs DDL only, never VACUUM
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA cache_size=-64000")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+    
+    raw = engine.raw_connection()
     try:
-        with engine.connect() as conn:
-            logger.info("Starting database migration...")
-            
-            # 1. Create job_descriptions table
-            logger.info("Creating job_descriptions table...")
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS job_descriptions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    internship_id INTEGER NOT NULL UNIQUE,
-                    description_text TEXT NOT NULL,
-                    role_type VARCHAR(50) NOT NULL,
-                    required_skills JSON,
-                    preferred_skills JSON,
-                    questions_data JSON NOT NULL,
-                    created_by INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    is_active BOOLEAN DEFAULT 1,
-                    FOREIGN KEY (internship_id) REFERENCES internships(id),
-                    FOREIGN KEY (created_by) REFERENCES users(id)
-                )
-            """))
-            conn.commit()
-            logger.success("Created job_descriptions table")
-            
-            # 2. Add columns to questions table
-            logger.info("Adding columns to questions table...")
-            
-            # Check if columns exist
-            result = conn.execute(text("PRAGMA table_info(questions)"))
-            columns = [row[1] for row in result]
-            
-            if 'job_description_id' not in columns:
-                conn.execute(text("""
-                    ALTER TABLE questions 
-                    ADD COLUMN job_description_id INTEGER
-                """))
-                conn.execute(text("""
-                    CREATE INDEX IF NOT EXISTS idx_questions_job_description 
-                    ON questions(job_description_id)
-                """))
-                logger.success("Added job_description_id to questions")
-            else:
-                logger.info("job_description_id already exists in questions")
-            
-            if 'source' not in columns:
-                conn.execute(text("""
-                    ALTER TABLE questions 
-                    ADD COLUMN source VARCHAR(20) DEFAULT 'github'
-                """))
-                logger.success("Added source to questions")
-            else:
-                logger.info("source already exists in questions")
-            
-            conn.commit()
-            
-            # 3. Add column to internships table
-            logger.info("Adding column to internships table...")
-            
-            result = conn.execute(text("PRAGMA table_info(internships)"))
-            columns = [row[1] for row in result]
-            
-            if 'use_jd_questions' not in columns:
-                conn.execute(text("""
-                    ALTER TABLE internships 
-                    ADD COLUMN use_jd_questions BOOLEAN DEFAULT 0
-                """))
-                logger.success("Added use_jd_questions to internships")
+        logger.info("Starting database migration...")
+        
+        # One introspection query for the columns of both altered tables
+        cursor = raw.cursor()
+        cursor.execute("""
+            SELECT m.name, p.name
+            FROM sqlite_master AS m, pragma_table_info(m.name) AS p
+            WHERE m.type = 'table' AND m.name IN ('questions', 'internships')
+        """)
+        existing = frozenset(cursor)  # streamed straight off the cursor, no fetchall list
+        cursor.close()
+        missing = [(table, column, ddl) for table, column, ddl in NEW_COLUMNS if (table, column) not in existing]
+        
+        # The whole migration runs as one executescript call in one transaction.
+        # executescript commits any pending transaction first, hence the explicit
+        # BEGIN/COMMIT inside the script rather than an engine-level transaction
+        script = "".join([
+            "BEGIN;",
+            CREATE_JOB_DESCRIPTIONS,
+            *(f"ALTER TABLE {table} ADD COLUMN {column} {ddl};\n" for table, column, ddl in missing),
+            FINALIZE,
+            "COMMIT;",
+        ])
+        try:
+            raw.executescript(script)
+        except Exception:
+            # A failing statement stops the script with its transaction still open
+            if raw.in_transaction:
+                raw.rollback()
+            raise
+        
+        logger.success("Created job_descriptions table")
+        for table, column, _ in NEW_COLUMNS:
+            if (table, column) in existing:
+                logger.info(f"{column} already exists in {table}")
             else:
-                logger.info("use_jd_questions already exists in internships")
-            
-            conn.commit()
-            
-            logger.success("✅ Migration completed successfully!")
-            
-            # Print summary
-            print("\n" + "="*60)
-            print("MIGRATION SUMMARY")
-            print("="*60)
-            print("✅ Created job_descriptions table")
-            print("✅ Added job_description_id to questions table")
-            print("✅ Added source column to questions table")
-            print("✅ Added use_jd_questions to internships table")
-            print("="*60 + "\n")
-            
+                logger.success(f"Added {column} to {table}")
+        
+        logger.success("✅ Migration completed successfully!")
+        
+        # Print summary
+        print("\n" + "="*60)
+        print("MIGRATION SUMMARY")
+        print("="*60)
+        print("✅ Created job_descriptions table")
+        print("✅ Added job_description_id to questions table")
+        print("✅ Added source column to questions table")
+        print("✅ Added use_jd_questions to internships table")
+        print("="*60 + "\n")
+        
     except Exception as e:
         logger.error(f"Migration failed: {e}")
         raise
     finally:
+        raw.close()
         engine.dispose()
 
 
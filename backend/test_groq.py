@@ -1,14 +1,30 @@
 """
 Test script to verify Groq integration
 """
-from groq import Groq
-import json
+from groq import Groq, DefaultHttpxClient
+import orjson
 import os
+import re
 from dotenv import load_dotenv
 
 load_dotenv()
 
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One module-wide client: its keep-alive pool is reused across calls, so only the
+# first request pays the TLS handshake. DefaultHttpxClient keeps the SDK's limits/timeouts
+client = Groq(
+    api_key=os.getenv("GROQ_API_KEY"),
+    http_client=DefaultHttpxClient(http2=HTTP2_AVAILABLE)
+)
+
+# Body of the first ``` / ```json fenced block - the model may add prose after the fence
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
 
 # Test simple JSON response
 prompt = """Return a JSON object with these fields:
@@ -34,15 +50,16 @@ print("\n" + "="*50 + "\n")
 
 # Extract JSON if wrapped in markdown
 if content.startswith("```"):
-    content = content.split("```json")[-1] if "```json" in content else content.split("```")[-1]
-    content = content.split("```")[0].strip()
+    match = _FENCE_RE.search(content)
+    if match:
+        content = match.group(1)
     print("Extracted JSON:")
     print(content)
     print("\n" + "="*50 + "\n")
 
 try:
-    data = json.loads(content)
+    data = orjson.loads(content)
     print("Parsed successfully!")
-    print(json.dumps(data, indent=2))
+    print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
 except Exception as e:
     print(f"Parse error: {e}")
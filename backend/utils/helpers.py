@@ -4,32 +4,53 @@ Utility functions and helpers
 import os
 import hashlib
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Set
 
 
 def generate_id(prefix: str, text: str) -> str:
     """Generate a unique ID"""
-    hash_obj = hashlib.md5(text.encode())
-    return f"{prefix}_{hash_obj.hexdigest()[:8]}"
+    # Non-cryptographic short id - a 4-byte blake2b digest is already 8 hex chars
+    hash_obj = hashlib.blake2b(text.encode(), digest_size=4)
+    return f"{prefix}_{hash_obj.hexdigest()}"
+
+
+# Directories already created by this process - repeat calls skip the mkdir syscall.
+# Only for long-lived directories: one removed later won't be recreated here.
+_ENSURED_DIRS: Set[str] = set()
 
 
 def ensure_dir(directory: str):
     """Ensure directory exists"""
-    os.makedirs(directory, exist_ok=True)
+    if directory in _ENSURED_DIRS:
+        return
+    # Try the leaf first - one mkdir when the parent exists; makedirs only walks
+    # the path when a parent is missing
+    try:
+        os.mkdir(directory)
+    except FileExistsError:
+        if not os.path.isdir(directory):
+            raise
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+    _ENSURED_DIRS.add(directory)
 
 
 def format_date(date: datetime) -> str:
     """Format datetime to string"""
-    return date.strftime("%Y-%m-%d %H:%M:%S")
+    # Same "%Y-%m-%d %H:%M:%S" output via isoformat's C fast path; drop tzinfo so
+    # aware datetimes don't gain a "+00:00" suffix
+    if date.tzinfo is not None:
+        date = date.replace(tzinfo=None)
+    return date.isoformat(sep=' ', timespec='seconds')
+
+
+# Invalid filename characters -> '_', applied in a single translate pass
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
 
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename"""
-    # Remove invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    return filename.translate(_SANITIZE_TABLE)
 
 
 def calculate_percentage(value: float, total: float) -> float:
@@ -37,3 +58,8 @@ def calculate_percentage(value: float, total: float) -> float:
     if total == 0:
         return 0.0
     return (value / total) * 100
+
+
+def calculate_percentages(values: Iterable[float], totals: Iterable[float]) -> List[float]:
+    """Calculate percentages pairwise in one pass (0.0 where total is 0)"""
+    return [(value / total) * 100 if total else 0.0 for value, total in zip(values, totals)]